@@ -12,11 +12,43 @@ import cv2
 import numpy as np
 from typing import Tuple, Dict, List, Optional
 from pathlib import Path
+import threading
+import copy
+import json
+import os
 import sys
 
 # Add parent directory to path for shared module imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+from shared.video_utils import open_video_capture
+
+try:
+    from .frame_statistics import compute_histogram
+except ImportError:
+    from frame_statistics import compute_histogram
+
+# Scalar metrics produced for every analyzed frame, in storage order
+FRAME_METRICS = (
+    'mean_brightness',
+    'std_brightness',
+    'dark_pixels_ratio',
+    'bright_pixels_ratio',
+    'mid_pixels_ratio',
+    'dynamic_range',
+    'rms_contrast',
+    'min_value',
+    'max_value'
+)
+
+# Bumped whenever the analysis algorithm changes, so cached results from an
+# older version are not reused
+ANALYSIS_CACHE_VERSION = 3
+
+# Maximum number of video analyses kept in the cache; the least recently
+# used entries are evicted first
+MAX_CACHED_ANALYSES = 500
+
 
 class BrightnessAnalyzer:
     """
@@ -37,54 +69,117 @@ class BrightnessAnalyzer:
         self.low_contrast_threshold = 40  # Standard deviation threshold for low contrast
         self.optimal_contrast_range = (50, 80)  # Optimal contrast range
 
+        # Frames are downscaled so their largest side is at most this many pixels
+        # before the histogram is computed; mean, spread and pixel ratios are
+        # essentially scale-invariant (min/max use the full-resolution frame)
+        self.analysis_max_dimension = 360
+
+        # Histogram bins holding more than this fraction of pixels can be peaks
+        self.peak_threshold_ratio = 0.01
+
+        # Frame sampling settings
+        self.max_sequential_gap = 250  # Decode sequentially when samples are at most this many frames apart
+
+        # Video analyses are cached by file identity and persisted between sessions
+        self.cache_file = Path.home() / '.video_processing' / 'brightness_cache.json'
+        self._analysis_cache = None  # Loaded from disk on first use
+        self._analysis_cache_dirty = False  # In-memory entries not yet written
+        self._cache_lock = threading.Lock()
+
     def analyze_frame(self, frame: np.ndarray) -> Dict[str, float]:
         """
         Analyze a single frame for brightness and contrast characteristics.
 
         Args:
-            frame (np.ndarray): Input video frame (BGR format)
+            frame (np.ndarray): Input video frame (BGR or single-channel grayscale)
 
         Returns:
             Dict[str, float]: Analysis results containing various metrics
         """
-        # Convert to grayscale for analysis
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        metrics, hist_peaks = self._compute_frame_metrics(frame)
+
+        analysis = dict(zip(FRAME_METRICS, metrics.tolist()))
+        analysis['histogram_peaks'] = hist_peaks
+
+        return analysis
 
-        # Calculate basic statistics
-        mean_brightness = np.mean(gray)
-        std_brightness = np.std(gray)
+    def _compute_frame_metrics(self, frame: np.ndarray) -> Tuple[np.ndarray, List[int]]:
+        """
+        Compute the scalar metrics of a frame as a flat array.
 
-        # Calculate histogram
-        hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-        hist_normalized = hist.flatten() / hist.sum()
+        Args:
+            frame (np.ndarray): Input video frame (BGR format)
 
-        # Analyze brightness distribution
-        dark_pixels_ratio = np.sum(hist_normalized[:self.dark_threshold])
-        bright_pixels_ratio = np.sum(hist_normalized[self.bright_threshold:])
+        Returns:
+            Tuple[np.ndarray, List[int]]: Metric values ordered as FRAME_METRICS,
+            and the histogram peak positions
+        """
+        # Convert to grayscale for analysis - single-channel frames already are
+        if frame.ndim == 2:
+            gray = frame
+        elif frame.shape[2] == 1:
+            gray = frame[:, :, 0]
+        else:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # Extremes come from the full-resolution frame - area averaging would
+        # pull them towards the mean and shrink the dynamic range
+        min_value, max_value, _, _ = cv2.minMaxLoc(gray)
+        min_val = int(min_value)
+        max_val = int(max_value)
+
+        # Subsample large frames for the histogram. Nearest-neighbour picks
+        # existing pixels without averaging them, so the spread, the dark/bright
+        # ratios and the peak positions match the full frame closely, while the
+        # histogram pass touches far fewer pixels. Area interpolation would
+        # smooth the luma and bias all of them
+        frame_height, frame_width = gray.shape[:2]
+        largest_side = max(frame_height, frame_width)
+        if largest_side > self.analysis_max_dimension:
+            scale = self.analysis_max_dimension / largest_side
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_NEAREST)
+
+        # Calculate histogram - this is the only pass over the downscaled frame,
+        # the remaining statistics are derived from the 256 integer bin counts
+        hist = compute_histogram(gray)
+        cumulative = np.cumsum(hist)
+        total_pixels = gray.size  # Equals the histogram sum, no reduction needed
+        bins = np.arange(256, dtype=np.float64)
+
+        # Calculate basic statistics from the histogram
+        mean_brightness = (hist * bins).sum() / total_pixels
+        variance = (hist * (bins - mean_brightness) ** 2).sum() / total_pixels
+        std_brightness = np.sqrt(variance)
+
+        # Analyze brightness distribution using the cumulative pixel counts
+        dark_pixels_ratio = cumulative[self.dark_threshold - 1] / total_pixels
+        bright_pixels_ratio = (total_pixels - cumulative[self.bright_threshold - 1]) / total_pixels
         mid_pixels_ratio = 1.0 - dark_pixels_ratio - bright_pixels_ratio
 
-        # Calculate dynamic range
-        min_val, max_val = np.min(gray), np.max(gray)
+        # Calculate dynamic range from the full-resolution extremes
         dynamic_range = max_val - min_val
 
-        # Calculate contrast using RMS contrast
-        rms_contrast = np.sqrt(np.mean((gray - mean_brightness) ** 2))
+        # RMS contrast is the population standard deviation of the intensities
+        rms_contrast = std_brightness
 
-        # Detect histogram peaks to assess exposure
-        hist_peaks = self._detect_histogram_peaks(hist_normalized)
+        # Detect histogram peaks to assess exposure, with the 1%-of-pixels
+        # threshold expressed as an absolute pixel count
+        peak_threshold = int(self.peak_threshold_ratio * total_pixels)
+        hist_peaks = self._detect_histogram_peaks(hist, peak_threshold)
 
-        return {
-            'mean_brightness': mean_brightness,
-            'std_brightness': std_brightness,
-            'dark_pixels_ratio': dark_pixels_ratio,
-            'bright_pixels_ratio': bright_pixels_ratio,
-            'mid_pixels_ratio': mid_pixels_ratio,
-            'dynamic_range': dynamic_range,
-            'rms_contrast': rms_contrast,
-            'histogram_peaks': hist_peaks,
-            'min_value': min_val,
-            'max_value': max_val
-        }
+        metrics = np.array([
+            mean_brightness,
+            std_brightness,
+            dark_pixels_ratio,
+            bright_pixels_ratio,
+            mid_pixels_ratio,
+            dynamic_range,
+            rms_contrast,
+            min_val,
+            max_val
+        ], dtype=np.float64)
+
+        return metrics, hist_peaks
 
     def analyze_video_sample(self, video_path: str, sample_frames: int = 10) -> Dict[str, float]:
         """
@@ -97,7 +192,34 @@ class BrightnessAnalyzer:
         Returns:
             Dict[str, float]: Average analysis results across sampled frames
         """
-        cap = cv2.VideoCapture(video_path)
+        # Reuse a previous analysis if the file has not changed since
+        cache_entry = self._get_cache_entry(video_path, sample_frames)
+        if cache_entry is not None:
+            cached_analysis = self._lookup_cached_analysis(*cache_entry)
+            if cached_analysis is not None:
+                return cached_analysis
+
+        avg_analysis = self._analyze_sampled_frames(video_path, sample_frames)
+
+        if cache_entry is not None:
+            self._store_cached_analysis(*cache_entry, avg_analysis)
+            self._save_analysis_cache()
+
+        return avg_analysis
+
+    def _analyze_sampled_frames(self, video_path: str, sample_frames: int) -> Dict[str, float]:
+        """
+        Decode and analyze evenly spaced frames of a video (uncached).
+
+        Args:
+            video_path (str): Path to the video file
+            sample_frames (int): Number of frames to sample for analysis
+
+        Returns:
+            Dict[str, float]: Average analysis results across sampled frames
+        """
+        # Decode on the GPU when the OpenCV build supports it
+        cap = open_video_capture(video_path)
 
         if not cap.isOpened():
             raise ValueError(f"Cannot open video file: {video_path}")
@@ -112,34 +234,197 @@ class BrightnessAnalyzer:
         # Calculate frame indices to sample evenly throughout the video
         frame_indices = np.linspace(0, total_frames - 1, min(sample_frames, total_frames), dtype=int)
 
-        analyses = []
-
-        for frame_idx in frame_indices:
-            # Seek to the specific frame
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-            ret, frame = cap.read()
+        # One row of metrics per sampled frame, filled as frames are read
+        frame_metrics = np.empty((len(frame_indices), len(FRAME_METRICS)), dtype=np.float64)
+        all_peaks = []
+        analyzed_count = 0
 
-            if ret:
-                analysis = self.analyze_frame(frame)
-                analyses.append(analysis)
+        for frame in self._read_sample_frames(cap, frame_indices, total_frames):
+            frame_metrics[analyzed_count], hist_peaks = self._compute_frame_metrics(frame)
+            all_peaks.append(hist_peaks)
+            analyzed_count += 1
 
         cap.release()
 
-        if not analyses:
+        if analyzed_count == 0:
             raise ValueError(f"Could not analyze any frames from video: {video_path}")
 
-        # Calculate average metrics across all analyzed frames
-        avg_analysis = {}
-        for key in analyses[0].keys():
-            if key == 'histogram_peaks':
-                # For peaks, take the most common peak position
-                all_peaks = [analysis[key] for analysis in analyses]
-                avg_analysis[key] = self._average_peaks(all_peaks)
-            else:
-                avg_analysis[key] = np.mean([analysis[key] for analysis in analyses])
+        # Calculate average metrics across all analyzed frames in one reduction
+        average_metrics = frame_metrics[:analyzed_count].mean(axis=0)
+        avg_analysis = dict(zip(FRAME_METRICS, average_metrics.tolist()))
+
+        # For peaks, group similar peak positions across frames
+        avg_analysis['histogram_peaks'] = self._average_peaks(all_peaks)
 
         return avg_analysis
 
+    def _get_cache_entry(self, video_path: str, sample_frames: int) -> Optional[Tuple[str, List[int]]]:
+        """
+        Build the cache key and file signature identifying a video analysis.
+
+        The key includes the analyzer settings that affect the results, so
+        changing them does not return analyses computed with other settings.
+
+        Args:
+            video_path (str): Path to the video file
+            sample_frames (int): Number of frames sampled for analysis
+
+        Returns:
+            Optional[Tuple[str, List[int]]]: Cache key and file signature
+            (modification time, size), or None if the file cannot be read
+        """
+        try:
+            file_stat = os.stat(video_path)
+        except OSError:
+            return None
+
+        settings = (ANALYSIS_CACHE_VERSION, self.analysis_max_dimension,
+                    self.dark_threshold, self.bright_threshold,
+                    self.peak_threshold_ratio, self.max_sequential_gap)
+        settings_key = ",".join(str(value) for value in settings)
+
+        cache_key = f"{os.path.abspath(video_path)}|{sample_frames}|{settings_key}"
+        return cache_key, [file_stat.st_mtime_ns, file_stat.st_size]
+
+    def _lookup_cached_analysis(self, cache_key: str, signature: List[int]) -> Optional[Dict[str, float]]:
+        """
+        Return a cached analysis if it matches the current file signature.
+
+        Args:
+            cache_key (str): Cache key from _get_cache_entry
+            signature (List[int]): Current file signature from _get_cache_entry
+
+        Returns:
+            Optional[Dict[str, float]]: Copy of the cached analysis, or None on a miss
+        """
+        with self._cache_lock:
+            cache = self._load_analysis_cache()
+            entry = cache.get(cache_key)
+
+            if entry is None or entry.get('signature') != signature:
+                return None
+
+            # Mark as most recently used for eviction
+            cache[cache_key] = cache.pop(cache_key)
+
+            # Deep copy - the peak list must not be shared with the cache
+            return copy.deepcopy(entry['analysis'])
+
+    def _store_cached_analysis(self, cache_key: str, signature: List[int],
+                               analysis: Dict[str, float]):
+        """
+        Store an analysis in the in-memory cache.
+
+        The cache file is written separately by _save_analysis_cache.
+
+        Args:
+            cache_key (str): Cache key from _get_cache_entry
+            signature (List[int]): File signature from _get_cache_entry
+            analysis (Dict[str, float]): Analysis results to store
+        """
+        with self._cache_lock:
+            cache = self._load_analysis_cache()
+            cache.pop(cache_key, None)
+            cache[cache_key] = {'signature': signature, 'analysis': copy.deepcopy(analysis)}
+
+            # Evict the least recently used entries (dicts keep insertion order)
+            while len(cache) > MAX_CACHED_ANALYSES:
+                del cache[next(iter(cache))]
+
+            self._analysis_cache_dirty = True
+
+    def _save_analysis_cache(self):
+        """
+        Write the analysis cache file if it changed since the last write.
+
+        The file is written to a temporary sibling and renamed over the cache
+        file, so an interrupted write never leaves a truncated cache.
+        """
+        with self._cache_lock:
+            if not self._analysis_cache_dirty:
+                return
+
+            temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._analysis_cache, f)
+                os.replace(temp_file, self.cache_file)
+                self._analysis_cache_dirty = False
+            except (OSError, TypeError, ValueError):
+                # The cache is only an optimization - keep the in-memory copy
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+
+    def _load_analysis_cache(self) -> Dict[str, Dict]:
+        """
+        Load the analysis cache from disk on first use.
+
+        Must be called with the cache lock held.
+
+        Returns:
+            Dict[str, Dict]: Cache entries keyed by cache key
+        """
+        if self._analysis_cache is None:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._analysis_cache = json.load(f)
+            except (OSError, ValueError):
+                self._analysis_cache = {}
+
+            if not isinstance(self._analysis_cache, dict):
+                self._analysis_cache = {}
+
+        return self._analysis_cache
+
+    def _read_sample_frames(self, cap: cv2.VideoCapture, frame_indices: np.ndarray, total_frames: int):
+        """
+        Yield the frames at the requested indices from an open video capture.
+
+        When the samples are close together the video is decoded sequentially,
+        using grab() to skip unwanted frames and retrieve() only for sampled ones.
+        This avoids a keyframe seek and re-decode per sample and is always frame
+        accurate. Widely spaced samples fall back to seeking, since decoding every
+        frame of a long video would cost more than a handful of seeks.
+
+        Args:
+            cap (cv2.VideoCapture): Open video capture positioned at the first frame
+            frame_indices (np.ndarray): Sorted, unique frame indices to read
+            total_frames (int): Total number of frames in the video
+
+        Yields:
+            np.ndarray: Decoded frames (BGR format) that could be read
+        """
+        sample_gap = total_frames / max(1, len(frame_indices))
+
+        if sample_gap > self.max_sequential_gap:
+            for frame_idx in frame_indices:
+                # Seek to the specific frame
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+                ret, frame = cap.read()
+
+                if ret:
+                    yield frame
+            return
+
+        current_idx = 0
+        for frame_idx in frame_indices:
+            # Skip frames without converting them until the next sample
+            while current_idx < frame_idx:
+                if not cap.grab():
+                    return
+                current_idx += 1
+
+            if not cap.grab():
+                return
+            current_idx += 1
+
+            ret, frame = cap.retrieve()
+            if ret:
+                yield frame
+
     def suggest_adjustments(self, analysis: Dict[str, float]) -> Dict[str, int]:
         """
         Suggest brightness and contrast adjustments based on analysis results.
@@ -153,10 +438,11 @@ class BrightnessAnalyzer:
         brightness_adjustment = 0
         contrast_adjustment = 0
 
-        mean_brightness = analysis['mean_brightness']
-        rms_contrast = analysis['rms_contrast']
-        dark_pixels_ratio = analysis['dark_pixels_ratio']
-        bright_pixels_ratio = analysis['bright_pixels_ratio']
+        # Convert once to native floats so the comparisons below avoid numpy scalars
+        mean_brightness = float(analysis['mean_brightness'])
+        rms_contrast = float(analysis['rms_contrast'])
+        dark_pixels_ratio = float(analysis['dark_pixels_ratio'])
+        bright_pixels_ratio = float(analysis['bright_pixels_ratio'])
 
         # Brightness adjustment suggestions
         if mean_brightness < self.optimal_mean_range[0]:
@@ -197,10 +483,11 @@ class BrightnessAnalyzer:
         Returns:
             str: Human-readable description of the video characteristics
         """
-        mean_brightness = analysis['mean_brightness']
-        rms_contrast = analysis['rms_contrast']
-        dark_pixels_ratio = analysis['dark_pixels_ratio']
-        bright_pixels_ratio = analysis['bright_pixels_ratio']
+        # Convert once to native floats so the comparisons below avoid numpy scalars
+        mean_brightness = float(analysis['mean_brightness'])
+        rms_contrast = float(analysis['rms_contrast'])
+        dark_pixels_ratio = float(analysis['dark_pixels_ratio'])
+        bright_pixels_ratio = float(analysis['bright_pixels_ratio'])
 
         description_parts = []
 
@@ -228,27 +515,25 @@ class BrightnessAnalyzer:
 
         return ", ".join(description_parts).capitalize()
 
-    def _detect_histogram_peaks(self, hist_normalized: np.ndarray) -> List[int]:
+    def _detect_histogram_peaks(self, hist: np.ndarray, threshold: int) -> List[int]:
         """
         Detect peaks in the histogram to identify dominant brightness values.
 
         Args:
-            hist_normalized (np.ndarray): Normalized histogram
+            hist (np.ndarray): Histogram of integer pixel counts
+            threshold (int): Minimum pixel count for a bin to be a peak
 
         Returns:
             List[int]: List of histogram peak positions
         """
-        # Use simple peak detection - find local maxima above threshold
-        peaks = []
-        threshold = 0.01  # 1% of pixels
-
-        for i in range(1, len(hist_normalized) - 1):
-            if (hist_normalized[i] > threshold and
-                hist_normalized[i] > hist_normalized[i-1] and
-                hist_normalized[i] > hist_normalized[i+1]):
-                peaks.append(i)
+        # Use simple peak detection - find local maxima above threshold.
+        # Compare every interior bin against both neighbours at once
+        interior = hist[1:-1]
+        mask = ((interior > threshold) &
+                (interior > hist[:-2]) &
+                (interior > hist[2:]))
 
-        return peaks
+        return (np.nonzero(mask)[0] + 1).tolist()
 
     def _average_peaks(self, all_peaks: List[List[int]]) -> List[int]:
         """
@@ -263,21 +548,24 @@ class BrightnessAnalyzer:
         if not all_peaks:
             return []
 
-        # Flatten all peaks and find the most common ones
-        all_peak_values = []
-        for peaks in all_peaks:
-            all_peak_values.extend(peaks)
+        # Flatten all peaks into one array
+        all_peak_values = np.fromiter(
+            (peak for peaks in all_peaks for peak in peaks), dtype=np.int32
+        )
 
-        if not all_peak_values:
+        if all_peak_values.size == 0:
             return []
 
+        # Sort and drop duplicates in numpy - peaks are histogram bins, so at
+        # most 254 distinct values remain however many frames were sampled
+        distinct_peaks = np.unique(all_peak_values).tolist()
+
         # Group similar peak values and return representatives
         unique_peaks = []
-        all_peak_values.sort()
 
-        for peak in all_peak_values:
+        for peak in distinct_peaks:
             # Group peaks within 10 units of each other
-            if not unique_peaks or abs(peak - unique_peaks[-1]) > 10:
+            if not unique_peaks or peak - unique_peaks[-1] > 10:
                 unique_peaks.append(peak)
 
         return unique_peaks
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Frame Statistics Kernels
+
+This module provides the native kernel used to compute the intensity histogram
+of a grayscale frame for brightness analysis. The mean, standard deviation and
+dark/bright ratios are derived from the histogram by the BrightnessAnalyzer.
+
+When Numba is installed, the histogram is computed by a compiled serial kernel.
+It is deliberately not a parallel (prange) kernel: analyses run on several
+threads at once, Numba's default threading layer does not allow concurrent
+entry into parallel regions, and the downscaled analysis frames are too small
+to gain from it. Without Numba, np.bincount is used.
+
+Author: Video Processing Project
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - fall back to numpy histograms
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _histogram_kernel(pixels):
+        """
+        Count the occurrences of each uint8 value in a flat pixel array.
+
+        Runs serially and releases the GIL, so concurrent analyses on
+        different threads each count their own frame safely.
+        """
+        hist = np.zeros(256, dtype=np.int64)
+        for i in range(pixels.size):
+            hist[pixels[i]] += 1
+
+        return hist
+
+
+def compute_histogram(gray: np.ndarray) -> np.ndarray:
+    """
+    Compute the 256-bin intensity histogram of a grayscale frame.
+
+    Args:
+        gray (np.ndarray): Single-channel uint8 frame
+
+    Returns:
+        np.ndarray: Pixel counts per intensity value (int64, length 256)
+    """
+    if NUMBA_AVAILABLE:
+        return _histogram_kernel(np.ascontiguousarray(gray).ravel())
+
+    # bincount returns integer counts directly and skips calcHist's float32
+    # output and wrapper overhead for a plain 1-D, 256-bin histogram
+    return np.bincount(gray.ravel(), minlength=256)
+
+
+def warm_up():
+    """
+    Compile the native kernel ahead of the first real analysis.
+
+    Numba compiles on the first call (or loads the on-disk cache written by
+    cache=True), which can take around a second. Calling this on a background
+    thread at startup moves that cost off the first analysis; Numba serializes
+    compilation, so a concurrent first call waits for it instead of compiling
+    again. Does nothing when Numba is not installed.
+    """
+    if NUMBA_AVAILABLE:
+        # Same argument type as compute_histogram passes: contiguous 1-D uint8
+        _histogram_kernel(np.zeros(8 * 8, dtype=np.uint8))
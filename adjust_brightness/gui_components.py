@@ -16,21 +16,27 @@ from pathlib import Path
 import sys
 import threading
 import time
+import os
+import queue
 from typing import Optional, Callable, List
 
 # Add parent directory to path for shared module imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from shared.file_utils import find_video_files, create_output_directory
-from shared.video_utils import is_valid_video_file, get_video_info
 
 try:
     from .brightness_analyzer import BrightnessAnalyzer
+    from .frame_statistics import warm_up as warm_up_frame_statistics
     from .video_processor import VideoProcessor
 except ImportError:
     from brightness_analyzer import BrightnessAnalyzer
+    from frame_statistics import warm_up as warm_up_frame_statistics
     from video_processor import VideoProcessor
 
+# Interval at which GUI updates posted by worker threads are applied
+UI_PUMP_INTERVAL_MS = 30
+
 
 class AdjustBrightnessGUI:
     """
@@ -51,18 +57,43 @@ class AdjustBrightnessGUI:
         self.analyzer = BrightnessAnalyzer()
         self.processor = VideoProcessor()
 
+        # Compile the analysis kernel in the background so neither the window
+        # nor the first analysis waits for the JIT. Numba compiles under a global
+        # lock, so an analysis that starts meanwhile just waits for the result
+        threading.Thread(target=warm_up_frame_statistics, daemon=True).start()
+
         # Current state variables
         self.current_video_path = None
         self.preview_frame = None
+        self._preview_source_frame = None  # Full-resolution preview frame (BGR)
+        self._preview_base_small = None  # Preview frame resized to the canvas (YCrCb)
+        self._preview_base_luma = None  # Unadjusted luma plane of the resized frame
+        self._preview_base_size = None  # Canvas size the resized frame was built for
+        self._preview_interactive = False  # True while the canvas is being resized
+        self._preview_settle_job = None
+        self._preview_buffer = None  # RGBX pixels shared with the PIL image below
+        self._preview_pil_image = None
+        self._preview_dirty = False  # An update was skipped while the preview was hidden
+        self._preview_applied = None  # (brightness, contrast) shown in the display image
         self.is_batch_mode = False
         self.batch_video_files = []
         self.batch_output_dir = None
 
+        # Number of videos encoded at the same time in batch mode. The processor
+        # splits the CPU threads between the concurrent FFmpeg encodes
+        self.max_parallel_videos = min(4, os.cpu_count() or 1)
+
         # GUI control variables
         self.brightness_var = tk.IntVar(value=0)
         self.contrast_var = tk.IntVar(value=0)
         self.progress_var = tk.DoubleVar(value=0)
 
+        # Preview update scheduling - slider events are coalesced into one redraw
+        self._preview_pending = False
+
+        # GUI calls posted by worker threads, run together by _ui_pump
+        self._ui_queue = queue.Queue()
+
         # Create GUI components
         self._create_widgets()
         self._setup_bindings()
@@ -70,6 +101,9 @@ class AdjustBrightnessGUI:
         # Configure grid weights for responsive layout
         self._configure_layout()
 
+        # Start running GUI updates posted by worker threads
+        self.root.after(UI_PUMP_INTERVAL_MS, self._ui_pump)
+
     def _create_widgets(self):
         """Create all GUI widgets and layout."""
         # Main container with padding
@@ -125,6 +159,10 @@ class AdjustBrightnessGUI:
         self.preview_canvas = tk.Canvas(preview_frame, width=800, height=450, bg="black")
         self.preview_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        # Single image item reused for every preview - it is reconfigured and
+        # moved instead of being deleted and recreated on each update
+        self._preview_image_id = self.preview_canvas.create_image(400, 225, anchor=tk.CENTER)
+
         # Preview info
         self.preview_info_label = ttk.Label(preview_frame,
                                             text="Select a video file to see preview",
@@ -239,6 +277,17 @@ class AdjustBrightnessGUI:
         self.brightness_var.trace('w', self._update_value_labels)
         self.contrast_var.trace('w', self._update_value_labels)
 
+        # Rebuild the resized preview frame when the canvas changes size
+        self.preview_canvas.bind('<Configure>', self._on_preview_configure)
+
+        # Catch up on updates skipped while the window was minimized. Bound on
+        # the toplevel, which also receives the events of its child widgets
+        self.root.bind('<Map>', self._on_window_map, add='+')
+
+        # Redraw once more when a slider is released so the final value is shown
+        self.brightness_scale.bind('<ButtonRelease-1>', self._on_adjustment_release)
+        self.contrast_scale.bind('<ButtonRelease-1>', self._on_adjustment_release)
+
     def _select_video_file(self):
         """Handle single video file selection."""
         filetypes = [
@@ -271,6 +320,11 @@ class AdjustBrightnessGUI:
             self.batch_video_files = video_files
             self.is_batch_mode = True
 
+            # Probe the remaining videos in the background while the user adjusts
+            # settings, filling the processor's video info cache
+            threading.Thread(target=self._prefetch_video_info, args=(video_files[1:],),
+                             daemon=True).start()
+
             # Load the first video for preview
             self._load_video(video_files[0])
 
@@ -283,8 +337,9 @@ class AdjustBrightnessGUI:
     def _load_video(self, video_path: str):
         """Load a video for preview and analysis."""
         try:
-            # Validate video file
-            if not is_valid_video_file(video_path):
+            # Validate video file (cached by the processor until the file changes)
+            is_valid, video_info = self.processor.get_cached_video_info(video_path)
+            if not is_valid:
                 messagebox.showerror("Invalid File", f"The selected file is not a valid video: {video_path}")
                 return
 
@@ -295,10 +350,16 @@ class AdjustBrightnessGUI:
                 filename = Path(video_path).name
                 self.current_file_label.config(text=f"File: {filename}", foreground="blue")
 
-            # Create preview frame
-            preview_frame = self.processor.create_preview_frame(video_path)
+            # Create preview frame. The canvas can never be larger than the
+            # screen, so decode-size frames beyond that are never displayed
+            screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            preview_frame = self.processor.create_preview_frame(video_path, max_size=screen_size)
 
             if preview_frame is not None:
+                # Keep the frame for in-process previews; the resized copy is rebuilt lazily
+                self._preview_source_frame = preview_frame
+                self._preview_base_small = None
+
                 # Display first frame
                 self._update_preview()
 
@@ -306,7 +367,6 @@ class AdjustBrightnessGUI:
                 self._analyze_current_video()
 
                 # Update preview info
-                video_info = get_video_info(video_path)
                 if video_info:
                     duration_str = f"{video_info['duration']:.1f}s"
                     resolution_str = video_info['resolution']
@@ -320,44 +380,139 @@ class AdjustBrightnessGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Error loading video: {e}")
 
+    def _prefetch_video_info(self, video_paths: List[str]):
+        """Worker thread that fills the processor's video info cache for a list of videos."""
+        for video_path in video_paths:
+            self.processor.get_cached_video_info(video_path)
+
     def _update_preview(self):
         """Update the video preview with current adjustments."""
         if not self.current_video_path:
             return
 
+        # Nothing to draw while the window is minimized or the canvas is hidden;
+        # remember the update so it happens once the preview is shown again
+        if not self.preview_canvas.winfo_viewable() or self.root.state() == 'iconic':
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+
         try:
             # Get adjusted frame
             brightness = self.brightness_var.get()
             contrast = self.contrast_var.get()
 
-            adjusted_frame = self.processor.apply_preview_adjustments(brightness, contrast)
+            canvas_width = self.preview_canvas.winfo_width()
+            canvas_height = self.preview_canvas.winfo_height()
+
+            if canvas_width > 1 and canvas_height > 1:  # Ensure canvas is initialized
+                base_frame = self._get_preview_base(canvas_width, canvas_height)
+
+                # The display image already shows these values (it is reset
+                # whenever the resized frame is rebuilt)
+                if self._preview_buffer is not None and self._preview_applied == (brightness, contrast):
+                    return
+
+                if base_frame is not None:
+                    if brightness == 0 and contrast == 0:
+                        # No adjustment - restore the untouched luma without a LUT pass
+                        base_frame[:, :, 0] = self._preview_base_luma
+                    else:
+                        # Brightness/contrast is a per-pixel transform on luma, so adjusting
+                        # the canvas-sized frame looks the same as adjusting then resizing
+                        lut = self.processor.get_adjustment_lut(brightness, contrast)
+                        base_frame[:, :, 0] = cv2.LUT(self._preview_base_luma, lut)
+
+                    if self._preview_buffer is None:
+                        self._create_preview_image(base_frame.shape[1], base_frame.shape[0],
+                                                   canvas_width, canvas_height)
+
+                    # Convert to RGB and into the buffer behind the PIL image,
+                    # then push the pixels into the existing Tk image
+                    frame_rgb = cv2.cvtColor(base_frame, cv2.COLOR_YCrCb2RGB)
+                    cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2RGBA, dst=self._preview_buffer)
+                    self.preview_frame.paste(self._preview_pil_image)
+                    self._preview_applied = (brightness, contrast)
 
-            if adjusted_frame is not None:
-                # Convert BGR to RGB for display
-                frame_rgb = cv2.cvtColor(adjusted_frame, cv2.COLOR_BGR2RGB)
+        except Exception as e:
+            print(f"Error updating preview: {e}")
 
-                # Resize frame to fit canvas while preserving aspect ratio
-                canvas_width = self.preview_canvas.winfo_width()
-                canvas_height = self.preview_canvas.winfo_height()
+    def _get_preview_base(self, canvas_width: int, canvas_height: int) -> Optional[np.ndarray]:
+        """
+        Get the preview frame resized to the canvas, rebuilding it if needed.
 
-                if canvas_width > 1 and canvas_height > 1:  # Ensure canvas is initialized
-                    frame_resized = self._resize_frame_preserve_aspect(
-                        frame_rgb, canvas_width, canvas_height
-                    )
+        The frame is converted to YCrCb once here, so slider updates only remap
+        its luma channel from the untouched copy in _preview_base_luma.
 
-                    # Convert to PIL Image and then to ImageTk
-                    pil_image = Image.fromarray(frame_resized)
-                    self.preview_frame = ImageTk.PhotoImage(pil_image)
+        Args:
+            canvas_width (int): Current canvas width
+            canvas_height (int): Current canvas height
 
-                    # Update canvas
-                    self.preview_canvas.delete("all")
-                    self.preview_canvas.create_image(
-                        canvas_width // 2, canvas_height // 2,
-                        image=self.preview_frame
-                    )
+        Returns:
+            Optional[np.ndarray]: Canvas-sized preview frame (YCrCb) or None if no video
+        """
+        if self._preview_source_frame is None:
+            return None
+
+        if self._preview_base_small is None or self._preview_base_size != (canvas_width, canvas_height):
+            # Use a cheap interpolation while the window is being resized
+            interpolation = cv2.INTER_NEAREST if self._preview_interactive else cv2.INTER_AREA
+            resized_frame = self._resize_frame_preserve_aspect(
+                self._preview_source_frame, canvas_width, canvas_height, interpolation
+            )
+            self._preview_base_small = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2YCrCb)
+            self._preview_base_luma = self._preview_base_small[:, :, 0].copy()
+            self._preview_base_size = (canvas_width, canvas_height)
 
-        except Exception as e:
-            print(f"Error updating preview: {e}")
+            # The display image must be recreated for the new size
+            self._preview_buffer = None
+
+        return self._preview_base_small
+
+    def _create_preview_image(self, width: int, height: int, canvas_width: int, canvas_height: int):
+        """
+        Create the reusable display image for previews of the given size.
+
+        A numpy RGBX buffer backs a PIL image without copying, and a single
+        PhotoImage is updated from it with paste() on every preview update.
+
+        Args:
+            width (int): Preview image width
+            height (int): Preview image height
+            canvas_width (int): Current canvas width
+            canvas_height (int): Current canvas height
+        """
+        self._preview_buffer = np.zeros((height, width, 4), dtype=np.uint8)
+        self._preview_pil_image = Image.frombuffer('RGBX', (width, height), self._preview_buffer,
+                                                   'raw', 'RGBX', 0, 1)
+        self.preview_frame = ImageTk.PhotoImage(self._preview_pil_image)
+
+        # Show the new image in the existing canvas item, centered
+        self.preview_canvas.itemconfig(self._preview_image_id, image=self.preview_frame)
+        self.preview_canvas.coords(self._preview_image_id, canvas_width // 2, canvas_height // 2)
+
+    def _on_preview_configure(self, event=None):
+        """Handle preview canvas resizing."""
+        self._preview_base_small = None
+        self._preview_interactive = True
+        self._on_adjustment_change()
+
+        # Rebuild once more with full quality when resizing has settled
+        if self._preview_settle_job is not None:
+            self.root.after_cancel(self._preview_settle_job)
+        self._preview_settle_job = self.root.after(200, self._on_preview_settled)
+
+    def _on_preview_settled(self):
+        """Redraw the preview with full-quality resizing after a canvas resize."""
+        self._preview_settle_job = None
+        self._preview_interactive = False
+        self._preview_base_small = None
+        self._update_preview()
+
+    def _on_window_map(self, event=None):
+        """Redraw the preview if updates were skipped while it was hidden."""
+        if self._preview_dirty:
+            self._on_adjustment_change()
 
     def _analyze_current_video(self):
         """Analyze the current video and display results."""
@@ -371,7 +526,7 @@ class AdjustBrightnessGUI:
                 description = self.analyzer.get_analysis_description(analysis)
 
                 # Update GUI in main thread
-                self.root.after(0, lambda: self._display_analysis_results(analysis, description))
+                self._post_to_ui(self._display_analysis_results, analysis, description)
 
             threading.Thread(target=analyze, daemon=True).start()
 
@@ -430,7 +585,20 @@ class AdjustBrightnessGUI:
         self._update_preview()
 
     def _on_adjustment_change(self, *args):
-        """Handle slider value changes."""
+        """Handle slider value changes by scheduling a coalesced preview update."""
+        # Dragging fires an event per pixel - only keep one update in flight,
+        # it reads the latest slider values when it runs
+        if not self._preview_pending:
+            self._preview_pending = True
+            self.root.after(30, self._do_preview)
+
+    def _do_preview(self):
+        """Run a scheduled preview update."""
+        self._preview_pending = False
+        self._update_preview()
+
+    def _on_adjustment_release(self, event=None):
+        """Handle slider release with an immediate preview update."""
         self._update_preview()
 
     def _update_value_labels(self, *args):
@@ -493,12 +661,12 @@ class AdjustBrightnessGUI:
             )
 
             # Update progress
-            self.root.after(0, lambda: self.progress_label.config(text=f"Processing: {Path(video_path).name}"))
-            self.root.after(0, lambda: self.progress_var.set(0))
+            self._post_to_ui(self.progress_label.config, text=f"Processing: {Path(video_path).name}")
+            self._post_to_ui(self.progress_var.set, 0)
 
             # Progress callback
             def progress_callback(percent):
-                self.root.after(0, lambda: self.progress_var.set(percent))
+                self._post_to_ui(self.progress_var.set, percent)
 
             # Process video
             success = self.processor.apply_brightness_contrast(
@@ -507,14 +675,14 @@ class AdjustBrightnessGUI:
 
             # Update GUI
             if success:
-                self.root.after(0, lambda: self.progress_label.config(text="Processing completed successfully"))
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"Video processed successfully:\n{output_path}"))
+                self._post_to_ui(self.progress_label.config, text="Processing completed successfully")
+                self._post_to_ui(messagebox.showinfo, "Success", f"Video processed successfully:\n{output_path}")
             else:
-                self.root.after(0, lambda: self.progress_label.config(text="Processing failed"))
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to process video: {video_path}"))
+                self._post_to_ui(self.progress_label.config, text="Processing failed")
+                self._post_to_ui(messagebox.showerror, "Error", f"Failed to process video: {video_path}")
 
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Error processing video: {e}"))
+            self._post_to_ui(messagebox.showerror, "Error", f"Error processing video: {e}")
 
     def _process_batch_worker(self):
         """Worker thread for batch processing videos."""
@@ -522,48 +690,89 @@ class AdjustBrightnessGUI:
             brightness = self.brightness_var.get()
             contrast = self.contrast_var.get()
             total_videos = len(self.batch_video_files)
-            processed_count = 0
 
-            for i, video_path in enumerate(self.batch_video_files):
-                # Update overall progress
-                overall_progress = (i / total_videos) * 100
-                self.root.after(0, lambda p=overall_progress: self.progress_var.set(p))
-                self.root.after(0, lambda v=Path(video_path).name, c=i+1, t=total_videos:
-                               self.progress_label.config(text=f"Processing {c}/{t}: {v}"))
-
-                # Generate output path
+            # Assign all output paths up front - jobs run concurrently, so a name
+            # must not be reused before the earlier file has been written
+            output_paths = []
+            reserved_paths = set()
+            for video_path in self.batch_video_files:
                 output_path = self.processor.generate_output_path(
-                    video_path, self.batch_output_dir, brightness, contrast
-                )
-
-                # Process video
-                success = self.processor.apply_brightness_contrast(
-                    video_path, output_path, brightness, contrast
+                    video_path, self.batch_output_dir, brightness, contrast, reserved_paths
                 )
-
-                if success:
-                    processed_count += 1
+                reserved_paths.add(output_path)
+                output_paths.append(output_path)
+
+            self._post_to_ui(self.progress_var.set, 0)
+            self._post_to_ui(self.progress_label.config,
+                             text=f"Processing {total_videos} videos ({self.max_parallel_videos} at a time)...")
+
+            # Update overall progress as each video finishes
+            def on_video_finished(video_path, success, finished_count, total):
+                self._post_to_ui(self.progress_var.set, (finished_count / total) * 100)
+                self._post_to_ui(self.progress_label.config,
+                                 text=f"Finished {finished_count}/{total}: {Path(video_path).name}")
+
+            # Run several FFmpeg jobs at once
+            results = self.processor.process_batch(
+                self.batch_video_files, output_paths, brightness, contrast,
+                self.max_parallel_videos, on_video_finished
+            )
+            processed_count = sum(results)
 
             # Final update
-            self.root.after(0, lambda: self.progress_var.set(100))
-            self.root.after(0, lambda: self.progress_label.config(text=f"Batch processing completed: {processed_count}/{total_videos} videos processed"))
+            self._post_to_ui(self.progress_var.set, 100)
+            self._post_to_ui(self.progress_label.config,
+                             text=f"Batch processing completed: {processed_count}/{total_videos} videos processed")
 
             # Show completion message
             message = f"Batch processing completed!\n"
             message += f"Successfully processed: {processed_count}/{total_videos} videos"
-            self.root.after(0, lambda: messagebox.showinfo("Batch Complete", message))
+            self._post_to_ui(messagebox.showinfo, "Batch Complete", message)
 
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Error during batch processing: {e}"))
+            self._post_to_ui(messagebox.showerror, "Error", f"Error during batch processing: {e}")
 
-    def _resize_frame_preserve_aspect(self, frame: np.ndarray, target_width: int, target_height: int) -> np.ndarray:
+    def _post_to_ui(self, func: Callable, *args, **kwargs):
         """
-        Resize frame while preserving aspect ratio and adding padding if needed.
+        Queue a GUI call from a worker thread to run on the main thread.
 
         Args:
-            frame (np.ndarray): Input frame in RGB format
+            func (Callable): Function to call on the main thread
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+        """
+        self._ui_queue.put((func, args, kwargs))
+
+    def _ui_pump(self):
+        """Run all GUI calls queued by worker threads, then reschedule itself."""
+        try:
+            while True:
+                try:
+                    func, args, kwargs = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    print(f"Error running GUI update: {e}")
+        finally:
+            self.root.after(UI_PUMP_INTERVAL_MS, self._ui_pump)
+
+    def _resize_frame_preserve_aspect(self, frame: np.ndarray, target_width: int, target_height: int,
+                                      interpolation: int = cv2.INTER_AREA) -> np.ndarray:
+        """
+        Resize frame to fit within the target size while preserving aspect ratio.
+
+        No padding is added - the frame is drawn centered on the black preview
+        canvas, which provides the letterbox bars.
+
+        Args:
+            frame (np.ndarray): Input frame (3-channel)
             target_width (int): Target canvas width
             target_height (int): Target canvas height
+            interpolation (int): OpenCV interpolation flag (INTER_AREA gives the
+                best downscaling quality, INTER_NEAREST is fastest)
 
         Returns:
             np.ndarray: Resized frame with preserved aspect ratio
@@ -576,23 +785,11 @@ class AdjustBrightnessGUI:
         scale = min(scale_width, scale_height)
 
         # Calculate new dimensions
-        new_width = int(frame_width * scale)
-        new_height = int(frame_height * scale)
+        new_width = max(1, int(frame_width * scale))
+        new_height = max(1, int(frame_height * scale))
 
         # Resize the frame
-        resized_frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
-
-        # Create a black background of target size
-        result = np.zeros((target_height, target_width, 3), dtype=np.uint8)
-
-        # Calculate position to center the resized frame
-        x_offset = (target_width - new_width) // 2
-        y_offset = (target_height - new_height) // 2
-
-        # Place the resized frame in the center
-        result[y_offset:y_offset + new_height, x_offset:x_offset + new_width] = resized_frame
-
-        return result
+        return cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
 
     def _on_closing(self):
         """Handle application closing."""
@@ -17,7 +17,7 @@ Author: Video Processing Project
 """
 
 import sys
-import os
+import importlib.util
 from pathlib import Path
 
 # Add the parent directory to Python path to import shared modules
@@ -35,34 +35,27 @@ def check_gui_dependencies():
     """
     missing_deps = []
 
+    # Only locate the modules - the GUI imports them when it starts, so loading
+    # the heavy C extensions here would just add to startup time
+
     # Check tkinter availability
-    try:
-        import tkinter
-    except ImportError:
+    if importlib.util.find_spec("tkinter") is None:
         missing_deps.append("tkinter")
 
     # Check PIL/Pillow availability
-    try:
-        from PIL import Image, ImageTk
-    except ImportError:
+    if importlib.util.find_spec("PIL") is None:
         missing_deps.append("Pillow (PIL)")
 
     # Check OpenCV availability
-    try:
-        import cv2
-    except ImportError:
+    if importlib.util.find_spec("cv2") is None:
         missing_deps.append("opencv-python")
 
     # Check subprocess availability (should be built-in)
-    try:
-        import subprocess
-    except ImportError:
+    if importlib.util.find_spec("subprocess") is None:
         missing_deps.append("subprocess (built-in module)")
 
     # Check numpy availability
-    try:
-        import numpy
-    except ImportError:
+    if importlib.util.find_spec("numpy") is None:
         missing_deps.append("numpy")
 
     if missing_deps:
@@ -90,28 +83,27 @@ def check_ffmpeg_availability():
     """
     Check if FFmpeg is available for video processing.
 
+    Uses the video processor's cached PATH lookup, so the executable is not
+    run. Must be called after check_gui_dependencies, since the video
+    processor module imports OpenCV and NumPy.
+
     Returns:
         bool: True if FFmpeg is available, False otherwise
     """
     try:
-        import subprocess
-        result = subprocess.run(
-            ['ffmpeg', '-version'],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        print("Warning: FFmpeg is not installed or not available in system PATH.")
-        print("FFmpeg is required for video processing.")
-        print("Please install FFmpeg and ensure it's available in your system PATH.")
-        print("Download from: https://ffmpeg.org/download.html")
-        return False
-    except Exception:
-        print("Warning: Could not verify FFmpeg installation.")
-        print("Video processing may not work properly.")
-        return False
+        from .video_processor import find_ffmpeg
+    except ImportError:
+        # Handle relative imports when running directly
+        from video_processor import find_ffmpeg
+
+    if find_ffmpeg() is not None:
+        return True
+
+    print("Warning: FFmpeg is not installed or not available in system PATH.")
+    print("FFmpeg is required for video processing.")
+    print("Please install FFmpeg and ensure it's available in your system PATH.")
+    print("Download from: https://ffmpeg.org/download.html")
+    return False
 
 
 def main():
@@ -13,16 +13,62 @@ from pathlib import Path
 import sys
 import os
 import subprocess
-import re
-import tempfile
 import json
-from typing import Optional, Callable, Tuple
+import threading
+import shutil
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Callable, Tuple, Set, List
 
 # Add parent directory to path for shared module imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from shared.file_utils import create_output_directory, sanitize_filename, get_unique_filename
-from shared.video_utils import get_video_info, is_valid_video_file
+from shared.video_utils import VIDEO_EXTENSIONS, get_video_info, open_video_capture
+
+# Number of videos kept open for preview frame extraction
+MAX_CACHED_CAPTURES = 4
+
+# Number of decoded (video, time) source frames kept for previews
+MAX_CACHED_FRAMES = 4
+
+# 8-bit YUV formats the brightness/contrast filter works in (those of FFmpeg's eq filter)
+ADJUSTMENT_PIXEL_FORMATS = ('yuv420p|yuv422p|yuv444p|yuv410p|yuv411p|yuv440p|'
+                            'yuvj420p|yuvj422p|yuvj444p|yuvj440p')
+
+# Number of trailing FFmpeg stderr bytes kept for error messages
+STDERR_TAIL_BYTES = 4096
+
+# Software H.264 encoder settings used when no hardware encoder works
+SOFTWARE_ENCODER_ARGS = [
+    '-c:v', 'libx264',  # Use H.264 codec
+    '-crf', '18',       # High quality setting
+    '-preset', 'medium', # Balance speed vs compression
+]
+
+# Hardware H.264 encoders in order of preference, with settings comparable to
+# the software encoder's CRF 18
+HARDWARE_ENCODER_ARGS = [
+    ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '19', '-b:v', '0'],  # NVIDIA
+    ['-c:v', 'h264_qsv', '-global_quality', '19'],  # Intel Quick Sync
+    ['-c:v', 'h264_amf', '-rc', 'cqp', '-qp_i', '19', '-qp_p', '19'],  # AMD
+    ['-c:v', 'h264_videotoolbox', '-q:v', '65'],  # macOS
+]
+
+
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg() -> Optional[str]:
+    """
+    Locate the FFmpeg executable on the system PATH.
+
+    This is a filesystem lookup rather than running 'ffmpeg -version', and the
+    result is cached for the rest of the session.
+
+    Returns:
+        Optional[str]: Full path to FFmpeg or None if it is not installed
+    """
+    return shutil.which('ffmpeg')
 
 
 class VideoProcessor:
@@ -33,14 +79,46 @@ class VideoProcessor:
     maintaining original video properties and codec settings.
     """
 
-    def __init__(self):
-        """Initialize the video processor."""
+    def __init__(self, use_hardware_encoder: bool = True, use_hardware_decoder: bool = True):
+        """
+        Initialize the video processor.
+
+        Args:
+            use_hardware_encoder (bool): Whether to encode with a GPU H.264 encoder
+                when one is available
+            use_hardware_decoder (bool): Whether to let FFmpeg decode input videos
+                on the GPU when possible
+        """
         self.temp_dir = None
+        self.use_hardware_encoder = use_hardware_encoder
+        self.use_hardware_decoder = use_hardware_decoder
+
+        # Validity and metadata per video path, stored with the file's
+        # modification time and size so an edited file is probed again
+        self._info_cache = {}
+        self._info_lock = threading.Lock()
+
+        # Encoder arguments chosen on first use (see _get_video_encoder_args)
+        self._video_encoder_args = None
+        self._encoder_lock = threading.Lock()
         self.current_preview_frame = None
 
+        # Lookup table for the last brightness/contrast pair used by adjust_frame
+        self._adjustment_lut_key = None
+        self._adjustment_lut = None
+
+        # Open captures for recently previewed videos, least recently used first.
+        # Reopening a file rebuilds the demuxer, index and decoder every time
+        self._capture_cache = OrderedDict()
+
+        # Decoded preview source frames keyed by (video path, start time), least
+        # recently used first, so re-adjusting a position does not decode again
+        self._frame_cache = OrderedDict()
+
     def apply_brightness_contrast(self, input_path: str, output_path: str,
                                   brightness: int = 0, contrast: int = 0,
-                                  progress_callback: Optional[Callable[[float], None]] = None) -> bool:
+                                  progress_callback: Optional[Callable[[float], None]] = None,
+                                  threads: Optional[int] = None) -> bool:
         """
         Apply brightness and contrast adjustments to a video file using FFmpeg.
 
@@ -50,13 +128,16 @@ class VideoProcessor:
             brightness (int): Brightness adjustment (-100 to +100)
             contrast (int): Contrast adjustment (-100 to +100)
             progress_callback (Optional[Callable[[float], None]]): Callback for progress updates
+            threads (Optional[int]): Maximum number of threads FFmpeg may use
+                (defaults to FFmpeg's own choice)
 
         Returns:
             bool: True if processing successful, False otherwise
         """
         try:
             # Validate input file
-            if not is_valid_video_file(input_path):
+            is_valid, video_info = self.get_cached_video_info(input_path)
+            if not is_valid:
                 print(f"Error: Invalid video file: {input_path}")
                 return False
 
@@ -66,69 +147,62 @@ class VideoProcessor:
                 print(f"Error: Could not create output directory: {output_dir}")
                 return False
 
-            # Convert brightness and contrast values to match OpenCV preview calculation
-            # OpenCV uses: beta = brightness * 2.55, alpha = 1.0 + (contrast / 100.0)
-            # FFmpeg eq filter: brightness = beta/255, contrast = alpha
-            brightness_value = (brightness * 2.55) / 255.0  # Convert to FFmpeg range
-            contrast_value = 1.0 + (contrast / 100.0)  # Same as OpenCV alpha
+            # Without adjustments the output is the input - copy the file instead
+            # of decoding and re-encoding every frame
+            if brightness == 0 and contrast == 0 and \
+                    Path(input_path).suffix.lower() == Path(output_path).suffix.lower():
+                shutil.copy2(input_path, output_path)
+                if progress_callback:
+                    progress_callback(100.0)
+                print(f"Successfully copied unadjusted video: {output_path}")
+                return True
+
+            # Build FFmpeg command around the encoder arguments
+            input_args = ['ffmpeg', '-y']  # -y to overwrite output files
 
-            # Clamp values to safe ranges
-            brightness_value = max(-1.0, min(1.0, brightness_value))
-            contrast_value = max(0.1, min(3.0, contrast_value))
+            # Decode on the GPU when FFmpeg finds a usable device (it falls back
+            # to software otherwise); frames are downloaded for the filter
+            if self.use_hardware_decoder:
+                input_args.extend(['-hwaccel', 'auto'])
 
-            # Build FFmpeg command
-            cmd = [
-                'ffmpeg', '-y',  # -y to overwrite output files
-                '-i', input_path,
-            ]
+            input_args.extend(['-i', input_path])
 
             # Add video filter if adjustments are needed
             if brightness != 0 or contrast != 0:
-                filter_str = f"eq=brightness={brightness_value}:contrast={contrast_value}"
-                cmd.extend(['-vf', filter_str])
+                filter_str = self._get_adjustment_filter(brightness, contrast)
+                input_args.extend(['-vf', filter_str])
 
             # Add output settings for quality preservation
-            cmd.extend([
-                '-c:v', 'libx264',  # Use H.264 codec
-                '-crf', '18',       # High quality setting
-                '-preset', 'medium', # Balance speed vs compression
+            output_args = ['-threads', str(threads)] if threads else []
+            output_args.extend([
                 '-c:a', 'copy',     # Copy audio without re-encoding
+                '-progress', 'pipe:1',  # Machine-readable progress on stdout
+                '-nostats',             # No status line on stderr
                 output_path
             ])
 
             # Get video duration for progress calculation
-            video_info = get_video_info(input_path)
             total_duration = video_info['duration'] if video_info else 0
 
-            # Execute FFmpeg with progress monitoring
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            encoder_args = self._get_video_encoder_args()
+            returncode, stderr_output = self._run_ffmpeg_with_progress(
+                input_args + encoder_args + output_args, total_duration, progress_callback
             )
 
-            # Monitor progress
-            while True:
-                output = process.stderr.readline()
-                if output == '' and process.poll() is not None:
-                    break
-
-                if output and progress_callback and total_duration > 0:
-                    # Parse FFmpeg progress output
-                    progress = self._parse_ffmpeg_progress(output, total_duration)
-                    if progress is not None:
-                        progress_callback(progress)
-
-            # Wait for process to complete
-            process.wait()
-
-            if process.returncode == 0:
+            # The hardware encoder passed a one-frame probe, but a real job can
+            # still hit session, resolution or pixel format limits - retry once
+            # with the software encoder, which handles any input
+            if returncode != 0 and encoder_args is not SOFTWARE_ENCODER_ARGS:
+                print(f"Hardware encoding failed for {input_path}, retrying with libx264: "
+                      f"{stderr_output}")
+                returncode, stderr_output = self._run_ffmpeg_with_progress(
+                    input_args + SOFTWARE_ENCODER_ARGS + output_args, total_duration, progress_callback
+                )
+
+            if returncode == 0:
                 print(f"Successfully processed video: {output_path}")
                 return True
             else:
-                stderr_output = process.stderr.read() if process.stderr else "Unknown error"
                 print(f"FFmpeg error: {stderr_output}")
                 return False
 
@@ -136,17 +210,77 @@ class VideoProcessor:
             print(f"Error processing video {input_path}: {e}")
             return False
 
-    def create_preview_frame(self, video_path: str, start_time: float = 0) -> Optional[np.ndarray]:
+    def process_batch(self, input_paths: List[str], output_paths: List[str],
+                      brightness: int = 0, contrast: int = 0,
+                      max_parallel: Optional[int] = None,
+                      completion_callback: Optional[Callable[[str, bool, int, int], None]] = None) -> List[bool]:
+        """
+        Apply brightness and contrast adjustments to several videos concurrently.
+
+        Up to max_parallel FFmpeg processes run at once, and the CPU threads are
+        split between them so concurrent encodes do not oversubscribe the cores.
+
+        Args:
+            input_paths (List[str]): Paths to input video files
+            output_paths (List[str]): Output path for each input video
+            brightness (int): Brightness adjustment (-100 to +100)
+            contrast (int): Contrast adjustment (-100 to +100)
+            max_parallel (Optional[int]): Maximum number of videos processed at
+                once (defaults to min(4, CPU count))
+            completion_callback (Optional[Callable[[str, bool, int, int], None]]):
+                Called from a worker thread as each video finishes, with the input
+                path, whether it succeeded, the number finished and the total
+
+        Returns:
+            List[bool]: Success of each video, in input order
         """
-        Extract a preview frame from a video using FFmpeg.
+        cpu_count = os.cpu_count() or 1
+        max_parallel = max(1, max_parallel or min(4, cpu_count))
+        threads_per_job = max(1, cpu_count // max_parallel)
+        total_videos = len(input_paths)
+        results = [False] * total_videos
+
+        # The worker threads only wait on their FFmpeg processes
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {
+                executor.submit(self.apply_brightness_contrast, input_path, output_path,
+                                brightness, contrast, None, threads_per_job): index
+                for index, (input_path, output_path) in enumerate(zip(input_paths, output_paths))
+            }
+
+            # Report each video as soon as it finishes, in completion order
+            for finished_count, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                results[index] = future.result()
+
+                if completion_callback:
+                    completion_callback(input_paths[index], results[index], finished_count, total_videos)
+
+        return results
+
+    def create_preview_frame(self, video_path: str, start_time: float = 0,
+                             max_size: Optional[Tuple[int, int]] = None) -> Optional[np.ndarray]:
+        """
+        Extract a preview frame from a video.
+
+        The frame is read from a capture kept open for the video, so loading
+        the same video again only seeks. FFmpeg is used if that fails.
 
         Args:
             video_path (str): Path to the source video
             start_time (float): Time in seconds to extract frame from
+            max_size (Optional[Tuple[int, int]]): Maximum (width, height) of the
+                returned frame; larger frames are scaled down preserving aspect ratio
 
         Returns:
             Optional[np.ndarray]: Preview frame as BGR numpy array or None if error
         """
+        frame = self._get_source_frame(video_path, start_time)
+        if frame is not None:
+            frame = self._fit_frame_to_size(frame, max_size)
+            self.current_preview_frame = frame
+            return frame
+
         try:
             # Build FFmpeg command to extract a single frame
             cmd = [
@@ -154,10 +288,23 @@ class VideoProcessor:
                 '-ss', str(start_time),
                 '-i', video_path,
                 '-vframes', '1',
+            ]
+
+            # Let FFmpeg scale the frame down before it is encoded and piped
+            if max_size is not None:
+                max_width, max_height = max_size
+                cmd.extend([
+                    '-vf',
+                    f"scale='min(iw,{max_width})':'min(ih,{max_height})'"
+                    f":force_original_aspect_ratio=decrease"
+                ])
+
+            # BMP is uncompressed, so encoding and decoding it is a plain copy
+            cmd.extend([
                 '-f', 'image2pipe',
-                '-vcodec', 'png',
+                '-vcodec', 'bmp',
                 '-'
-            ]
+            ])
 
             # Execute FFmpeg
             process = subprocess.Popen(
@@ -170,12 +317,13 @@ class VideoProcessor:
             stdout, stderr = process.communicate()
 
             if process.returncode == 0 and stdout:
-                # Convert PNG data to numpy array
+                # Convert BMP data to numpy array
                 nparr = np.frombuffer(stdout, np.uint8)
                 frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
                 if frame is not None:
-                    self.current_preview_frame = frame.copy()
+                    # imdecode returns a new array, so it can be kept without a copy
+                    self.current_preview_frame = frame
                     return frame
 
             return None
@@ -184,15 +332,20 @@ class VideoProcessor:
             print(f"Error creating preview frame from {video_path}: {e}")
             return None
 
-    def apply_preview_adjustments(self, brightness: int = 0, contrast: int = 0) -> Optional[np.ndarray]:
+    def apply_preview_adjustments(self, brightness: int = 0, contrast: int = 0,
+                                  use_ffmpeg: bool = False) -> Optional[np.ndarray]:
         """
-        Apply brightness/contrast adjustments to the current preview frame using FFmpeg.
-        
-        This ensures the preview matches exactly what will be saved in the final video.
+        Apply brightness/contrast adjustments to the current preview frame.
+
+        By default the frame is adjusted in-process with adjust_frame, which
+        matches the FFmpeg filter used for the final video to within rounding
+        (see get_adjustment_lut). Set use_ffmpeg to run the frame through FFmpeg
+        itself instead, which is exact but starts a process per call.
 
         Args:
             brightness (int): Brightness adjustment (-100 to +100)
             contrast (int): Contrast adjustment (-100 to +100)
+            use_ffmpeg (bool): Whether to apply the adjustments with FFmpeg
 
         Returns:
             Optional[np.ndarray]: Adjusted frame as numpy array (BGR format) or None if error
@@ -200,36 +353,91 @@ class VideoProcessor:
         if self.current_preview_frame is None:
             return None
 
-        try:
-            # Use FFmpeg to apply adjustments for consistency with final output
-            # Create a temporary file for the current frame
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_input:
-                # Save current frame as PNG
-                cv2.imwrite(temp_input.name, self.current_preview_frame)
-                temp_input_path = temp_input.name
-
-            # Apply adjustments using FFmpeg
-            adjusted_frame = self._apply_ffmpeg_adjustments_to_frame(
-                temp_input_path, brightness, contrast
-            )
-
-            # Clean up temporary file
-            try:
-                os.unlink(temp_input_path)
-            except:
-                pass
-
-            return adjusted_frame
+        if use_ffmpeg:
+            return self._apply_ffmpeg_adjustments_to_frame(self.current_preview_frame, brightness, contrast)
 
+        try:
+            return self.adjust_frame(self.current_preview_frame, brightness, contrast)
         except Exception as e:
             print(f"Error applying preview adjustments: {e}")
             return None
 
+    def adjust_frame(self, frame: np.ndarray, brightness: int = 0, contrast: int = 0) -> np.ndarray:
+        """
+        Apply brightness/contrast adjustments to a frame in-process with OpenCV.
+
+        Uses the same curve as the FFmpeg filter used for the final video: the
+        luma channel is scaled around mid-grey by the contrast and offset by the
+        brightness, while the chroma channels are left unchanged. The result
+        matches the final video to within rounding, which makes it suitable for
+        interactive previews without spawning FFmpeg.
+
+        Args:
+            frame (np.ndarray): Input frame (BGR format)
+            brightness (int): Brightness adjustment (-100 to +100)
+            contrast (int): Contrast adjustment (-100 to +100)
+
+        Returns:
+            np.ndarray: Adjusted frame (BGR format)
+        """
+        lut = self.get_adjustment_lut(brightness, contrast)
+
+        # Only the luma channel is remapped - one table lookup per pixel
+        ycrcb = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb)
+        ycrcb[:, :, 0] = cv2.LUT(ycrcb[:, :, 0], lut)
+
+        return cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR)
+
+    def get_adjustment_lut(self, brightness: int = 0, contrast: int = 0) -> np.ndarray:
+        """
+        Get the 256-entry preview luma lookup table for a brightness/contrast pair.
+
+        The table is meant for OpenCV's full-range YCrCb luma of a BGR frame.
+        The final video's lutyuv filter (see _get_adjustment_filter) remaps the
+        video's limited-range Y plane (16-235) instead, so each value is
+        converted to limited range, passed through the output table and
+        converted back. Previews therefore match the output to within rounding.
+        The last table is cached, so repeated previews with unchanged settings
+        do not rebuild it.
+
+        Args:
+            brightness (int): Brightness adjustment (-100 to +100)
+            contrast (int): Contrast adjustment (-100 to +100)
+
+        Returns:
+            np.ndarray: Lookup table (uint8, length 256)
+        """
+        lut_key = (brightness, contrast)
+
+        if self._adjustment_lut_key != lut_key:
+            # Output table on Y values, as the lutyuv filter evaluates it. Curve
+            # documented for eq: v = contrast * (x / 255 - 0.5) + 0.5 + brightness,
+            # output 256 * v. With contrast = c / 100 and brightness = b / 100 this
+            # is exact in integers: 256 * (c * (2x - 255) + 25500 + 510 * b) / 51000
+            contrast_scale, brightness_scale = self._get_adjustment_scales(brightness, contrast)
+
+            values = np.arange(256, dtype=np.int32)
+            numerator = 256 * (contrast_scale * (2 * values - 255) + 25500 + 510 * brightness_scale)
+            output_table = np.clip(numerator // 51000, 0, 255)
+
+            # Full-range luma -> limited-range Y -> output table -> full-range luma,
+            # clipped like the YUV to RGB conversion of the decoded output
+            limited = np.rint(16 + values * (219 / 255)).astype(np.int32)
+            full = np.rint((output_table[limited] - 16) * (255 / 219))
+
+            self._adjustment_lut = np.clip(full, 0, 255).astype(np.uint8)
+            self._adjustment_lut_key = lut_key
+
+        return self._adjustment_lut
+
     def create_preview_with_adjustments(self, video_path: str, brightness: int = 0,
                                        contrast: int = 0, start_time: float = 0) -> Optional[np.ndarray]:
         """
-        Create a preview frame with brightness/contrast adjustments applied using FFmpeg.
+        Create a preview frame with brightness/contrast adjustments applied.
+
+        The frame is read from the capture kept open for the video and adjusted
+        in-process, so previewing several positions of one video opens and
+        initializes its decoder only once. FFmpeg is used if that fails.
 
         Args:
             video_path (str): Path to the source video
@@ -240,15 +448,11 @@ class VideoProcessor:
         Returns:
             Optional[np.ndarray]: Adjusted preview frame or None if error
         """
-        try:
-            # Convert brightness and contrast values to FFmpeg format
-            brightness_value = brightness / 100.0
-            contrast_value = 1.0 + (contrast / 100.0)
-
-            # Clamp values
-            brightness_value = max(-1.0, min(1.0, brightness_value))
-            contrast_value = max(0.1, min(3.0, contrast_value))
+        frame = self._get_source_frame(video_path, start_time)
+        if frame is not None:
+            return self.adjust_frame(frame, brightness, contrast)
 
+        try:
             # Build FFmpeg command with filters
             cmd = [
                 'ffmpeg', '-y',
@@ -256,12 +460,12 @@ class VideoProcessor:
                 '-i', video_path,
                 '-vframes', '1',
                 '-f', 'image2pipe',
-                '-vcodec', 'png'
+                '-vcodec', 'bmp'
             ]
 
             # Add filter if adjustments are needed
             if brightness != 0 or contrast != 0:
-                filter_str = f"eq=brightness={brightness_value}:contrast={contrast_value}"
+                filter_str = self._get_adjustment_filter(brightness, contrast)
                 cmd.extend(['-vf', filter_str])
 
             cmd.append('-')
@@ -277,7 +481,7 @@ class VideoProcessor:
             stdout, stderr = process.communicate()
 
             if process.returncode == 0 and stdout:
-                # Convert PNG data to numpy array
+                # Convert BMP data to numpy array
                 nparr = np.frombuffer(stdout, np.uint8)
                 frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
                 return frame
@@ -289,7 +493,8 @@ class VideoProcessor:
             return None
 
     def generate_output_path(self, input_path: str, output_dir: str,
-                             brightness: int = 0, contrast: int = 0) -> str:
+                             brightness: int = 0, contrast: int = 0,
+                             reserved_paths: Optional[Set[str]] = None) -> str:
         """
         Generate an appropriate output path for processed video.
 
@@ -298,6 +503,8 @@ class VideoProcessor:
             output_dir (str): Output directory
             brightness (int): Brightness adjustment applied
             contrast (int): Contrast adjustment applied
+            reserved_paths (Optional[Set[str]]): Output paths already assigned to
+                other videos that have not been written yet
 
         Returns:
             str: Generated output path
@@ -319,101 +526,379 @@ class VideoProcessor:
         output_path = str(Path(output_dir) / f"{new_filename}{input_file.suffix}")
 
         # Ensure unique filename
-        return get_unique_filename(str(Path(output_path).with_suffix('')), input_file.suffix)
+        return get_unique_filename(str(Path(output_path).with_suffix('')), input_file.suffix,
+                                   reserved_paths)
 
     def check_ffmpeg_availability(self) -> bool:
         """
-        Check if FFmpeg is available and working.
+        Check if FFmpeg is available.
 
         Returns:
             bool: True if FFmpeg is available, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
-        except Exception:
-            return False
+        return find_ffmpeg() is not None
 
     def cleanup(self):
         """Clean up any temporary resources."""
         self.current_preview_frame = None
 
+        for cap in self._capture_cache.values():
+            cap.release()
+        self._capture_cache.clear()
+        self._frame_cache.clear()
+
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
                 os.rmdir(self.temp_dir)
             except:
                 pass  # Ignore cleanup errors
 
-    def _parse_ffmpeg_progress(self, output_line: str, total_duration: float) -> Optional[float]:
+    def _fit_frame_to_size(self, frame: np.ndarray,
+                           max_size: Optional[Tuple[int, int]]) -> np.ndarray:
         """
-        Parse FFmpeg progress output to extract completion percentage.
+        Scale a frame down to fit within a maximum size, preserving aspect ratio.
 
         Args:
-            output_line (str): Line from FFmpeg stderr output
-            total_duration (float): Total video duration in seconds
+            frame (np.ndarray): Input frame
+            max_size (Optional[Tuple[int, int]]): Maximum (width, height), or None to keep the frame
 
         Returns:
-            Optional[float]: Progress percentage (0-100) or None if cannot parse
+            np.ndarray: The frame itself if it already fits, otherwise a scaled copy
+        """
+        if max_size is None:
+            return frame
+
+        height, width = frame.shape[:2]
+        scale = min(max_size[0] / width, max_size[1] / height)
+        if scale >= 1:
+            return frame
+
+        new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        return cv2.resize(frame, new_size, interpolation=cv2.INTER_AREA)
+
+    def _get_cached_capture(self, video_path: str) -> Optional[cv2.VideoCapture]:
+        """
+        Get an open capture for a video, opening it on first use.
+
+        Args:
+            video_path (str): Path to the video file
+
+        Returns:
+            Optional[cv2.VideoCapture]: Open capture or None if the video cannot be opened
+        """
+        cap = self._capture_cache.get(video_path)
+        if cap is not None:
+            self._capture_cache.move_to_end(video_path)
+            return cap
+
+        cap = open_video_capture(video_path)
+        if not cap.isOpened():
+            cap.release()
+            return None
+
+        self._capture_cache[video_path] = cap
+        if len(self._capture_cache) > MAX_CACHED_CAPTURES:
+            _, oldest = self._capture_cache.popitem(last=False)
+            oldest.release()
+
+        return cap
+
+    def _get_source_frame(self, video_path: str, start_time: float) -> Optional[np.ndarray]:
+        """
+        Get the unadjusted frame at a given time, decoding it only once.
+
+        The returned frame is shared with the cache and is read-only.
+
+        Args:
+            video_path (str): Path to the video file
+            start_time (float): Time in seconds to read the frame from
+
+        Returns:
+            Optional[np.ndarray]: Frame (BGR) or None if it could not be read
+        """
+        key = (video_path, start_time)
+        frame = self._frame_cache.get(key)
+        if frame is not None:
+            self._frame_cache.move_to_end(key)
+            return frame
+
+        frame = self._read_cached_capture_frame(video_path, start_time)
+        if frame is not None:
+            # Shared by every caller, so make accidental in-place edits fail loudly
+            frame.setflags(write=False)
+            self._frame_cache[key] = frame
+            if len(self._frame_cache) > MAX_CACHED_FRAMES:
+                self._frame_cache.popitem(last=False)
+
+        return frame
+
+    def _read_cached_capture_frame(self, video_path: str, start_time: float) -> Optional[np.ndarray]:
+        """
+        Read the frame at a given time from the cached capture of a video.
+
+        Args:
+            video_path (str): Path to the video file
+            start_time (float): Time in seconds to read the frame from
+
+        Returns:
+            Optional[np.ndarray]: Frame (BGR) or None if it could not be read
         """
         try:
-            # Look for time= pattern in FFmpeg output
-            time_match = re.search(r'time=(\d+):(\d+):(\d+)\.(\d+)', output_line)
-            if time_match:
-                hours = int(time_match.group(1))
-                minutes = int(time_match.group(2))
-                seconds = int(time_match.group(3))
-                centiseconds = int(time_match.group(4))
-
-                current_time = hours * 3600 + minutes * 60 + seconds + centiseconds / 100.0
-                progress = min(100.0, (current_time / total_duration) * 100.0)
-                return progress
+            cap = self._get_cached_capture(video_path)
+            if cap is None:
+                return None
 
+            cap.set(cv2.CAP_PROP_POS_MSEC, start_time * 1000)
+            ret, frame = cap.read()
+            if ret:
+                return frame
+
+            # Drop a capture that stopped decoding so the next call reopens it
+            self._capture_cache.pop(video_path, None)
+            cap.release()
             return None
 
-        except Exception:
+        except Exception as e:
+            print(f"Error reading preview frame from {video_path}: {e}")
             return None
 
-    def _adjust_frame_brightness_contrast(self, frame: np.ndarray,
-                                          brightness: int, contrast: int) -> np.ndarray:
+    def get_cached_video_info(self, video_path: str) -> Tuple[bool, Optional[dict]]:
         """
-        Apply brightness and contrast adjustments to a single frame using OpenCV.
+        Check a video and get its information with a single probe per file.
+
+        One container open gives both the validity and the metadata (duration,
+        frame rate, dimensions) used by every caller. Results are cached per
+        path together with the file's modification time and size, so repeated
+        operations on the same file reuse them until the file changes.
+
+        Args:
+            video_path (str): Path to the video file
+
+        Returns:
+            Tuple[bool, Optional[dict]]: Whether the file is a valid video, and
+            its information from get_video_info (None if unavailable)
+        """
+        try:
+            file_stat = os.stat(video_path)
+        except OSError:
+            return False, None
+
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._info_lock:
+            cached = self._info_cache.get(video_path)
+            if cached is not None and cached[0] == signature:
+                return cached[1], cached[2]
+
+        # Same checks as is_valid_video_file, but the capture opened to read
+        # the metadata doubles as the readability check
+        video_info = None
+        if Path(video_path).suffix.lower() in VIDEO_EXTENSIONS:
+            video_info = get_video_info(video_path)
+        is_valid = video_info is not None
+
+        with self._info_lock:
+            self._info_cache[video_path] = (signature, is_valid, video_info)
+
+        return is_valid, video_info
+
+    def _get_video_encoder_args(self) -> list:
+        """
+        Get the FFmpeg video encoder arguments for final output.
+
+        The first hardware encoder that can encode a test frame is used, so a
+        listed encoder without a matching GPU or driver is skipped. The choice
+        is made once per processor; apply_brightness_contrast retries a failed
+        hardware encode with SOFTWARE_ENCODER_ARGS.
+
+        Returns:
+            list: FFmpeg arguments selecting and configuring the video encoder
+        """
+        with self._encoder_lock:
+            if self._video_encoder_args is None:
+                self._video_encoder_args = SOFTWARE_ENCODER_ARGS
+
+                if self.use_hardware_encoder:
+                    for encoder_args in HARDWARE_ENCODER_ARGS:
+                        if self._probe_video_encoder(encoder_args):
+                            self._video_encoder_args = encoder_args
+                            break
+
+            return self._video_encoder_args
+
+    def _probe_video_encoder(self, encoder_args: list) -> bool:
+        """
+        Check whether FFmpeg can encode with the given encoder settings.
+
+        Args:
+            encoder_args (list): FFmpeg arguments selecting and configuring the encoder
+
+        Returns:
+            bool: True if a short test clip encoded successfully, False otherwise
+        """
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:size=256x256:duration=0.1',
+                 '-frames:v', '1'] + encoder_args + ['-f', 'null', '-'],
+                capture_output=True,
+                timeout=15,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def _run_ffmpeg_with_progress(self, cmd: list, total_duration: float,
+                                  progress_callback: Optional[Callable[[float], None]]) -> Tuple[int, str]:
+        """
+        Run an FFmpeg command that writes -progress output to stdout.
+
+        Args:
+            cmd (list): FFmpeg command line, including '-progress pipe:1'
+            total_duration (float): Input duration in seconds (0 if unknown)
+            progress_callback (Optional[Callable[[float], None]]): Callback for progress updates
+
+        Returns:
+            Tuple[int, str]: FFmpeg's exit code and the end of its error output
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+
+        # Keep the end of stderr for error reporting. It must be drained
+        # while the process runs so FFmpeg never blocks on a full pipe
+        stderr_tail = bytearray()
+        stderr_thread = threading.Thread(
+            target=self._drain_stderr, args=(process, stderr_tail), daemon=True
+        )
+        stderr_thread.start()
+
+        # Monitor progress - FFmpeg writes key=value lines to stdout
+        for output in process.stdout:
+            if progress_callback and total_duration > 0:
+                progress = self._parse_ffmpeg_progress(output, total_duration)
+                if progress is not None:
+                    progress_callback(progress)
+
+        # Wait for process to complete
+        process.wait()
+        stderr_thread.join()
+
+        return process.returncode, stderr_tail.decode('utf-8', errors='replace') or "Unknown error"
+
+    def _get_adjustment_scales(self, brightness: int, contrast: int) -> Tuple[int, int]:
+        """
+        Convert slider values to the integer scales of the adjustment curve.
 
         Args:
-            frame (np.ndarray): Input frame (BGR format)
             brightness (int): Brightness adjustment (-100 to +100)
             contrast (int): Contrast adjustment (-100 to +100)
 
         Returns:
-            np.ndarray: Adjusted frame
+            Tuple[int, int]: Contrast in percent (10 to 300) and brightness in
+            percent of full range (-100 to 100)
+        """
+        # Slider brightness maps to beta = brightness * 2.55 on a 0-255 scale,
+        # i.e. brightness percent of full range; contrast is 1 + contrast / 100
+        contrast_scale = max(10, min(300, 100 + int(contrast)))
+        brightness_scale = max(-100, min(100, int(brightness)))
+
+        return contrast_scale, brightness_scale
+
+    def _get_adjustment_filter(self, brightness: int, contrast: int) -> str:
+        """
+        Build the FFmpeg filter that applies a brightness/contrast adjustment.
+
+        Uses lutyuv with the curve documented for the eq filter, evaluated
+        exactly in integers. eq itself computes the curve in floating point, so
+        its output can differ from this table by a few levels. The table is
+        applied to the video's Y plane (usually limited range);
+        get_adjustment_lut wraps the same table in the range conversion for the
+        full-range preview. The input is first converted to the 8-bit YUV
+        formats eq would negotiate; chroma is passed through unchanged.
+
+        Args:
+            brightness (int): Brightness adjustment (-100 to +100)
+            contrast (int): Contrast adjustment (-100 to +100)
+
+        Returns:
+            str: FFmpeg filter graph
+        """
+        contrast_scale, brightness_scale = self._get_adjustment_scales(brightness, contrast)
+        offset = 25500 + 510 * brightness_scale
+
+        luma_expr = f"clip(floor(256*({contrast_scale}*(2*val-255)+{offset})/51000),0,255)"
+        return f"format={ADJUSTMENT_PIXEL_FORMATS},lutyuv=y='{luma_expr}':u=val:v=val"
+
+    def _drain_stderr(self, process: subprocess.Popen, tail: bytearray):
         """
-        # Convert brightness and contrast to appropriate ranges
-        beta = brightness * 2.55  # Brightness adjustment in range [0, 255]
-        alpha = 1.0 + (contrast / 100.0)  # Contrast multiplier
+        Read a process's stderr until it closes, keeping only its last bytes.
 
-        # Clamp values to safe ranges
-        alpha = max(0.1, min(3.0, alpha))
-        beta = max(-255, min(255, beta))
+        The pipe is read in raw chunks straight from the file descriptor, so
+        there is no per-line decoding and FFmpeg's carriage-return status
+        updates cannot hold a read waiting for a newline.
 
-        # Apply adjustments: new_pixel = alpha * pixel + beta
-        adjusted = cv2.convertScaleAbs(frame, alpha=alpha, beta=beta)
+        Args:
+            process (subprocess.Popen): Running FFmpeg process
+            tail (bytearray): Receives the last STDERR_TAIL_BYTES of output
+        """
+        fd = process.stderr.fileno()
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+
+                tail += chunk
+                if len(tail) > STDERR_TAIL_BYTES:
+                    del tail[:-STDERR_TAIL_BYTES]
+        except OSError:
+            pass
+
+    def _parse_ffmpeg_progress(self, output_line: str, total_duration: float) -> Optional[float]:
+        """
+        Parse FFmpeg -progress output to extract completion percentage.
+
+        Args:
+            output_line (str): key=value line from FFmpeg's -progress output
+            total_duration (float): Total video duration in seconds
+
+        Returns:
+            Optional[float]: Progress percentage (0-100) or None if cannot parse
+        """
+        try:
+            # out_time_us (and the older, misnamed out_time_ms) hold the output
+            # position in microseconds
+            if output_line.startswith('out_time_us='):
+                microseconds = int(output_line[12:])
+            elif output_line.startswith('out_time_ms='):
+                microseconds = int(output_line[12:])
+            else:
+                return None
 
-        return adjusted
+            current_time = microseconds / 1e6
+            progress = min(100.0, (current_time / total_duration) * 100.0)
+            return progress
 
-    def _apply_ffmpeg_adjustments_to_frame(self, input_path: str, brightness: int, contrast: int) -> Optional[np.ndarray]:
+        except ValueError:
+            # Reported as N/A before the first frame is written
+            return None
+
+    def _apply_ffmpeg_adjustments_to_frame(self, frame: np.ndarray, brightness: int, contrast: int) -> Optional[np.ndarray]:
         """
         Apply brightness/contrast adjustments to a single frame using FFmpeg.
         
         This method uses the same FFmpeg processing as the final video output.
+        The frame is piped to FFmpeg as raw BGR pixels and read back the same
+        way, so no temporary file or image encoding is involved.
 
         Args:
-            input_path (str): Path to input image file
+            frame (np.ndarray): Input frame (BGR format)
             brightness (int): Brightness adjustment (-100 to +100)
             contrast (int): Contrast adjustment (-100 to +100)
 
@@ -421,49 +906,44 @@ class VideoProcessor:
             Optional[np.ndarray]: Adjusted frame as numpy array (BGR format) or None if error
         """
         try:
-            # Convert brightness and contrast values to match OpenCV preview calculation
-            # OpenCV uses: beta = brightness * 2.55, alpha = 1.0 + (contrast / 100.0)
-            # FFmpeg eq filter: brightness = beta/255, contrast = alpha
-            brightness_value = (brightness * 2.55) / 255.0  # Convert to FFmpeg range
-            contrast_value = 1.0 + (contrast / 100.0)  # Same as OpenCV alpha
+            height, width = frame.shape[:2]
 
-            # Clamp values to safe ranges
-            brightness_value = max(-1.0, min(1.0, brightness_value))
-            contrast_value = max(0.1, min(3.0, contrast_value))
-
-            # Build FFmpeg command for single frame processing
+            # Build FFmpeg command reading raw frame data from stdin
             cmd = [
                 'ffmpeg', '-y',
-                '-i', input_path,
+                '-f', 'rawvideo',
+                '-pix_fmt', 'bgr24',
+                '-s', f'{width}x{height}',
+                '-i', '-',
             ]
 
             # Add video filter if adjustments are needed
             if brightness != 0 or contrast != 0:
-                filter_str = f"eq=brightness={brightness_value}:contrast={contrast_value}"
+                filter_str = self._get_adjustment_filter(brightness, contrast)
                 cmd.extend(['-vf', filter_str])
 
-            # Output to stdout as PNG
+            # Output to stdout as raw frame data in the same layout
             cmd.extend([
-                '-f', 'image2pipe',
-                '-vcodec', 'png',
+                '-f', 'rawvideo',
+                '-pix_fmt', 'bgr24',
                 '-'
             ])
 
             # Execute FFmpeg
             process = subprocess.Popen(
                 cmd,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
             )
 
-            stdout, stderr = process.communicate()
+            stdout, stderr = process.communicate(input=np.ascontiguousarray(frame).tobytes())
 
-            if process.returncode == 0 and stdout:
-                # Convert PNG data to numpy array
-                nparr = np.frombuffer(stdout, np.uint8)
-                frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                return frame
+            frame_size = width * height * 3
+            if process.returncode == 0 and len(stdout) >= frame_size:
+                # Wrap the raw bytes as a frame without decoding
+                return np.frombuffer(stdout, np.uint8, count=frame_size).reshape(height, width, 3)
 
             return None
 
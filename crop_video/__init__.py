@@ -21,16 +21,33 @@ Author: Video Processing Project
 __version__ = "1.0.0"
 __author__ = "Video Processing Project"
 
-# Import main components for easier access
-try:
-    from .main import main
-    from .video_processor import CropVideoProcessor
-    from .rectangle_manager import Rectangle, RectangleManager
-    from .gui_components import CropVideoGUI
-    from .crop_data import CropDataManager
-except ImportError:
-    # Handle relative imports when running directly
-    pass
+import importlib
+
+# Main components for easier access, imported on first use so that importing
+# the package does not load tkinter, OpenCV and PIL up front (PEP 562)
+_LAZY_IMPORTS = {
+    'main': '.main',
+    'CropVideoProcessor': '.video_processor',
+    'Rectangle': '.rectangle_manager',
+    'RectangleManager': '.rectangle_manager',
+    'CropVideoGUI': '.gui_components',
+    'CropDataManager': '.crop_data',
+}
+
+
+def __getattr__(name):
+    """Import a main component from its submodule on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+
+    # Cache the component - this also replaces the submodule attribute that
+    # importing '.main' sets on the package with the main function itself
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'main',
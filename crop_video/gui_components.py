@@ -15,6 +15,7 @@ import numpy as np
 from pathlib import Path
 import sys
 import threading
+import time
 from typing import Optional, List, Tuple, Dict, Any
 
 # Add parent directory to path for shared module imports
@@ -32,6 +33,15 @@ except ImportError:
     from video_processor import CropVideoProcessor
     from crop_data import CropDataManager
 
+# Size of the resize handle hit area around rectangle edges, in canvas pixels
+RESIZE_HANDLE_HIT_SIZE = 8
+
+# Delay after the last canvas resize event before the preview is redrawn
+RESIZE_REDRAW_DELAY_MS = 80
+
+# Minimum time between cursor hit-tests on mouse motion (about 60 Hz)
+MOTION_INTERVAL_S = 0.016
+
 
 class CropVideoGUI:
     """
@@ -75,6 +85,33 @@ class CropVideoGUI:
         self.offset_y = 0
         self.resize_handle = None  # 'tl', 'tr', 'bl', 'br', 'top', 'bottom', 'left', 'right'
         self.original_rect_coords = None  # Store original coordinates for drag/resize operations
+        self._handle_hit_size = RESIZE_HANDLE_HIT_SIZE  # Resize handle hit size in video space
+
+        # Incremented per _load_video call so stale background loads are dropped
+        self._load_generation = 0
+
+        # Coalesced preview redraws (see _request_preview_update)
+        self._preview_dirty = False
+        self._preview_scheduled = False
+
+        # (frame id, canvas width, canvas height) the current self.photo was built for
+        self._preview_cache_key = None
+
+        # Persistent canvas items, updated in place on redraw
+        self._preview_image_id = None
+        self._rect_canvas_ids: Dict[Rectangle, Dict[str, int]] = {}
+        self._handle_canvas_ids: List[int] = []
+
+        # Rectangles whose items need moving at the next coalesced redraw
+        self._dirty_rectangles = set()
+
+        # Pending debounced redraw after a canvas resize
+        self._resize_after_id = None
+
+        # Mouse motion throttle state (see _on_canvas_motion)
+        self._last_motion_time = 0.0
+        self._pending_motion = None
+        self._motion_after_id = None
 
         # GUI control variables
         self.progress_var = tk.DoubleVar(value=0)
@@ -153,6 +190,11 @@ class CropVideoGUI:
         self.preview_canvas = tk.Canvas(preview_frame, width=800, height=450, bg="black")
         self.preview_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        # Direct Tcl access for the per-rectangle item commands, which skips
+        # tkinter's argument flattening and option conversion on every call
+        self._tk_call = self.preview_canvas.tk.call
+        self._canvas_path = str(self.preview_canvas)
+
         # Instructions
         instructions = ("Click and drag to draw crop rectangles.\n"
                        "Right-click on rectangles to rename or delete.\n"
@@ -265,6 +307,9 @@ class CropVideoGUI:
         self.preview_canvas.bind("<Button-3>", self._on_canvas_right_click)
         self.preview_canvas.bind("<Motion>", self._on_canvas_motion)
 
+        # Redraw the preview once the canvas has settled at a new size
+        self.preview_canvas.bind("<Configure>", self._on_canvas_configure)
+
         # Rectangle list selection
         self.rectangle_listbox.bind("<<ListboxSelect>>", self._on_rectangle_select)
 
@@ -316,48 +361,77 @@ class CropVideoGUI:
             messagebox.showinfo("Batch Mode Warning", warning_msg)
 
     def _load_video(self, video_path: str):
-        """Load a video for preview and cropping."""
+        """
+        Load a video for preview and cropping.
+
+        Opening the file and decoding the first frame can take a while for
+        large or remote videos, so it runs on a worker thread and the result
+        is applied on the UI thread by _apply_loaded_video.
+        """
+        # Only the most recent request is applied if several are in flight
+        self._load_generation += 1
+        threading.Thread(target=self._load_video_worker,
+                         args=(video_path, self._load_generation), daemon=True).start()
+
+    def _load_video_worker(self, video_path: str, generation: int):
+        """Worker thread that reads the first frame and info of a video (no Tk calls)."""
         try:
             # Validate video file
             if not is_valid_video_file(video_path):
-                messagebox.showerror("Invalid File", f"The selected file is not a valid video: {video_path}")
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Invalid File", f"The selected file is not a valid video: {video_path}"))
                 return
 
-            self.current_video_path = video_path
-
-            # Update display
-            if not self.is_batch_mode:
-                filename = Path(video_path).name
-                self.current_file_label.config(text=f"File: {filename}", foreground="blue")
-
             # Load first frame
             cap = cv2.VideoCapture(video_path)
-            ret, frame = cap.read()
-            cap.release()
+            try:
+                ret, frame = cap.read()
+            finally:
+                cap.release()
 
             if not ret:
-                messagebox.showerror("Error", f"Could not read video frame: {video_path}")
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Error", f"Could not read video frame: {video_path}"))
                 return
 
-            self.current_frame = frame
-            height, width = frame.shape[:2]
+            video_info = get_video_info(video_path)
 
-            # Update rectangle manager with video dimensions
-            self.rectangle_manager.set_video_dimensions(width, height)
+            self.root.after(0, lambda: self._apply_loaded_video(video_path, generation, frame, video_info))
 
-            # Display frame
-            self._update_preview()
+        except Exception as e:
+            # Format now - 'e' is unbound once the except block ends
+            message = f"Error loading video: {e}"
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
 
-            # Update info display
-            video_info = get_video_info(video_path)
-            if video_info:
-                info_text = (f"Resolution: {video_info['resolution']}, "
-                           f"Duration: {video_info['duration']:.1f}s, "
-                           f"FPS: {video_info['fps']:.1f}")
-                self.rectangle_info_label.config(text=info_text, foreground="black")
+    def _apply_loaded_video(self, video_path: str, generation: int,
+                            frame: np.ndarray, video_info: Optional[Dict[str, Any]]):
+        """Show a video loaded by _load_video_worker (runs on the UI thread)."""
+        if generation != self._load_generation:
+            return  # A newer video was requested while this one was loading
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading video: {e}")
+        self.current_video_path = video_path
+
+        # Update display
+        if not self.is_batch_mode:
+            filename = Path(video_path).name
+            self.current_file_label.config(text=f"File: {filename}", foreground="blue")
+
+        self.current_frame = frame
+        self._preview_cache_key = None  # id() of a freed frame can be reused
+        height, width = frame.shape[:2]
+
+        # Update rectangle manager with video dimensions
+        self.rectangle_manager.set_video_dimensions(width, height)
+
+        # Display frame
+        self._update_preview()
+
+        # Update info display
+        if video_info:
+            info_text = (f"Resolution: {video_info['resolution']}, "
+                       f"Duration: {video_info['duration']:.1f}s, "
+                       f"FPS: {video_info['fps']:.1f}")
+            self.rectangle_info_label.config(text=info_text, foreground="black")
 
     def _update_preview(self):
         """Update the video preview with current frame and rectangles."""
@@ -365,9 +439,6 @@ class CropVideoGUI:
             return
 
         try:
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-
             # Calculate scale factors
             canvas_width = self.preview_canvas.winfo_width()
             canvas_height = self.preview_canvas.winfo_height()
@@ -377,79 +448,202 @@ class CropVideoGUI:
                 self.root.after(100, self._update_preview)
                 return
 
-            frame_height, frame_width = frame_rgb.shape[:2]
-
-            # Calculate scale to fit canvas while preserving aspect ratio
-            scale_x = canvas_width / frame_width
-            scale_y = canvas_height / frame_height
-            scale = min(scale_x, scale_y)
+            # The scaled image only depends on the frame and canvas size, so
+            # overlay-only redraws (drag, resize, selection) reuse it
+            cache_key = (id(self.current_frame), canvas_width, canvas_height)
+            if cache_key != self._preview_cache_key:
+                frame_height, frame_width = self.current_frame.shape[:2]
+
+                # Calculate scale to fit canvas while preserving aspect ratio
+                scale_x = canvas_width / frame_width
+                scale_y = canvas_height / frame_height
+                scale = min(scale_x, scale_y)
+
+                # Calculate display dimensions
+                display_width = int(frame_width * scale)
+                display_height = int(frame_height * scale)
+
+                # Resize first, then convert BGR to RGB on the smaller image
+                resized_bgr = cv2.resize(self.current_frame, (display_width, display_height))
+                resized_frame = cv2.cvtColor(resized_bgr, cv2.COLOR_BGR2RGB)
+
+                # Center the image - the black canvas background fills the
+                # margins, so no padded copy of the frame is needed
+                x_offset = (canvas_width - display_width) // 2
+                y_offset = (canvas_height - display_height) // 2
+
+                # Convert to PIL
+                pil_image = Image.fromarray(resized_frame)
+                self.photo = ImageTk.PhotoImage(pil_image)
+
+                # Store scale factors for coordinate conversion
+                self.scale_x = display_width / frame_width
+                self.scale_y = display_height / frame_height
+                self._handle_hit_size = int(RESIZE_HANDLE_HIT_SIZE / min(self.scale_x, self.scale_y))
+                self.offset_x = x_offset
+                self.offset_y = y_offset
+
+                self._preview_cache_key = cache_key
+
+            # Show the image on a single persistent item, kept below the overlay
+            if self._preview_image_id is None:
+                self._preview_image_id = self.preview_canvas.create_image(
+                    self.offset_x, self.offset_y, image=self.photo, anchor="nw")
+                self.preview_canvas.tag_lower(self._preview_image_id)
+            else:
+                self.preview_canvas.itemconfigure(self._preview_image_id, image=self.photo)
+                self.preview_canvas.coords(self._preview_image_id, self.offset_x, self.offset_y)
 
-            # Calculate display dimensions
-            display_width = int(frame_width * scale)
-            display_height = int(frame_height * scale)
+            # Draw rectangles
+            self._draw_rectangles()
 
-            # Resize frame
-            resized_frame = cv2.resize(frame_rgb, (display_width, display_height))
+        except Exception as e:
+            print(f"Error updating preview: {e}")
 
-            # Create centered image
-            canvas_image = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
-            x_offset = (canvas_width - display_width) // 2
-            y_offset = (canvas_height - display_height) // 2
+    def _on_canvas_configure(self, event):
+        """
+        Handle canvas size changes.
 
-            canvas_image[y_offset:y_offset + display_height,
-                        x_offset:x_offset + display_width] = resized_frame
+        Live window resizing sends a burst of Configure events; each one
+        pushes the redraw back, so the preview is rebuilt once at the final size.
+        """
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(RESIZE_REDRAW_DELAY_MS, self._on_canvas_resized)
 
-            # Convert to PIL and display
-            pil_image = Image.fromarray(canvas_image)
-            self.photo = ImageTk.PhotoImage(pil_image)
+    def _on_canvas_resized(self):
+        """Redraw the preview after the canvas stopped resizing."""
+        self._resize_after_id = None
+        self._update_preview()
 
-            # Clear canvas and display image
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(canvas_width // 2, canvas_height // 2, image=self.photo)
+    def _request_preview_update(self, rectangle: Optional[Rectangle] = None):
+        """
+        Schedule a preview redraw for the next idle cycle.
 
-            # Store scale factors for coordinate conversion
-            self.scale_x = display_width / frame_width
-            self.scale_y = display_height / frame_height
-            self.offset_x = x_offset
-            self.offset_y = y_offset
+        Mouse motion can arrive hundreds of times per second; repeated
+        requests before the UI goes idle are merged into a single redraw.
 
-            # Draw rectangles
-            self._draw_rectangles()
+        Args:
+            rectangle (Optional[Rectangle]): Rectangle whose geometry changed;
+                only its canvas items are updated. None redraws everything.
+        """
+        if rectangle is None:
+            self._preview_dirty = True
+        else:
+            self._dirty_rectangles.add(rectangle)
+
+        if not self._preview_scheduled:
+            self._preview_scheduled = True
+            self.root.after_idle(self._flush_preview)
+
+    def _flush_preview(self):
+        """Run the redraw requested by _request_preview_update."""
+        self._preview_scheduled = False
+        if self._preview_dirty:
+            # A full redraw also covers every rectangle
+            self._preview_dirty = False
+            self._dirty_rectangles.clear()
+            self._update_preview()
+        else:
+            while self._dirty_rectangles:
+                self._update_rect_geometry(self._dirty_rectangles.pop())
 
-        except Exception as e:
-            print(f"Error updating preview: {e}")
+    def _rect_to_canvas_coords(self, rect: Rectangle) -> Tuple[float, float, float, float]:
+        """Convert a rectangle's video coordinates to canvas coordinates."""
+        return (self.offset_x + rect.x * self.scale_x,
+                self.offset_y + rect.y * self.scale_y,
+                self.offset_x + rect.x2 * self.scale_x,
+                self.offset_y + rect.y2 * self.scale_y)
 
     def _draw_rectangles(self):
-        """Draw all crop rectangles on the canvas."""
-        for rect in self.rectangle_manager.rectangles:
+        """
+        Draw all crop rectangles on the canvas.
+
+        Canvas items are created once per rectangle and afterwards only moved
+        and restyled, which is much cheaper than deleting and recreating them.
+        """
+        tk_call = self._tk_call
+        canvas_path = self._canvas_path
+        get_int = self.preview_canvas.tk.getint
+        rectangles = self.rectangle_manager.rectangles
+
+        # Remove items of rectangles that were deleted or replaced
+        current = set(rectangles)
+        for rect in [rect for rect in self._rect_canvas_ids if rect not in current]:
+            item_ids = self._rect_canvas_ids.pop(rect)
+            tk_call(canvas_path, 'delete', item_ids['rect'], item_ids['label'])
+
+        selected = None
+        for rect in rectangles:
             # Convert video coordinates to canvas coordinates
-            canvas_x1 = self.offset_x + rect.x * self.scale_x
-            canvas_y1 = self.offset_y + rect.y * self.scale_y
-            canvas_x2 = self.offset_x + rect.x2 * self.scale_x
-            canvas_y2 = self.offset_y + rect.y2 * self.scale_y
+            canvas_x1, canvas_y1, canvas_x2, canvas_y2 = self._rect_to_canvas_coords(rect)
 
-            # Draw rectangle
+            # Rectangle style
             outline_color = rect.color
             fill_color = rect.color if rect.selected else ""
             width = 3 if rect.selected else 2
+            stipple = "gray50" if rect.selected else ""
 
-            rect_id = self.preview_canvas.create_rectangle(
-                canvas_x1, canvas_y1, canvas_x2, canvas_y2,
-                outline=outline_color, fill=fill_color, width=width,
-                stipple="gray50" if rect.selected else ""
-            )
-
-            # Draw label
+            # Label position
             label_x = canvas_x1 + 5
             label_y = canvas_y1 + 5
-            self.preview_canvas.create_text(
-                label_x, label_y, text=rect.name, fill="white",
-                font=("Arial", 10, "bold"), anchor="nw"
-            )
 
-            # Draw resize handles for selected rectangle
+            item_ids = self._rect_canvas_ids.get(rect)
+            if item_ids is None:
+                self._rect_canvas_ids[rect] = {
+                    'rect': get_int(tk_call(
+                        canvas_path, 'create', 'rectangle',
+                        canvas_x1, canvas_y1, canvas_x2, canvas_y2,
+                        '-outline', outline_color, '-fill', fill_color, '-width', width,
+                        '-stipple', stipple
+                    )),
+                    'label': get_int(tk_call(
+                        canvas_path, 'create', 'text', label_x, label_y,
+                        '-text', rect.name, '-fill', 'white',
+                        '-font', ('Arial', 10, 'bold'), '-anchor', 'nw'
+                    ))
+                }
+            else:
+                tk_call(canvas_path, 'coords', item_ids['rect'],
+                        canvas_x1, canvas_y1, canvas_x2, canvas_y2)
+                tk_call(canvas_path, 'itemconfigure', item_ids['rect'],
+                        '-outline', outline_color, '-fill', fill_color,
+                        '-width', width, '-stipple', stipple)
+                tk_call(canvas_path, 'coords', item_ids['label'], label_x, label_y)
+                tk_call(canvas_path, 'itemconfigure', item_ids['label'], '-text', rect.name)
+
             if rect.selected:
-                self._draw_resize_handles(canvas_x1, canvas_y1, canvas_x2, canvas_y2)
+                selected = (canvas_x1, canvas_y1, canvas_x2, canvas_y2)
+
+        # Draw resize handles for selected rectangle
+        if selected:
+            self._draw_resize_handles(*selected)
+        elif self._handle_canvas_ids:
+            tk_call(canvas_path, 'itemconfigure', 'resize_handle', '-state', 'hidden')
+
+    def _update_rect_geometry(self, rect: Rectangle):
+        """
+        Move the canvas items of one rectangle to its current geometry.
+
+        Used while dragging or resizing, where nothing else on the canvas
+        changes.
+
+        Args:
+            rect (Rectangle): Rectangle that moved or changed size
+        """
+        item_ids = self._rect_canvas_ids.get(rect)
+        if item_ids is None:
+            # Not on the canvas yet - draw everything
+            self._update_preview()
+            return
+
+        canvas_x1, canvas_y1, canvas_x2, canvas_y2 = self._rect_to_canvas_coords(rect)
+        self._tk_call(self._canvas_path, 'coords', item_ids['rect'],
+                      canvas_x1, canvas_y1, canvas_x2, canvas_y2)
+        self._tk_call(self._canvas_path, 'coords', item_ids['label'], canvas_x1 + 5, canvas_y1 + 5)
+
+        if rect.selected:
+            self._draw_resize_handles(canvas_x1, canvas_y1, canvas_x2, canvas_y2)
 
     def _draw_resize_handles(self, canvas_x1: float, canvas_y1: float,
                            canvas_x2: float, canvas_y2: float):
@@ -470,13 +664,27 @@ class CropVideoGUI:
             (canvas_x2, (canvas_y1 + canvas_y2) / 2, 'right')   # Right center
         ]
 
-        # Draw each handle
-        for x, y, position in handles:
-            self.preview_canvas.create_rectangle(
-                x - handle_size // 2, y - handle_size // 2,
-                x + handle_size // 2, y + handle_size // 2,
-                fill=handle_color, outline=handle_outline, width=1
-            )
+        # The eight handle items are created once and moved afterwards
+        if not self._handle_canvas_ids:
+            self._handle_canvas_ids = [
+                self.preview_canvas.create_rectangle(
+                    0, 0, 0, 0, fill=handle_color, outline=handle_outline, width=1,
+                    tags=('resize_handle',)
+                )
+                for _ in handles
+            ]
+
+        # Move each handle
+        tk_call = self._tk_call
+        canvas_path = self._canvas_path
+        half_size = handle_size // 2
+        for item_id, (x, y, position) in zip(self._handle_canvas_ids, handles):
+            tk_call(canvas_path, 'coords', item_id,
+                    x - half_size, y - half_size, x + half_size, y + half_size)
+
+        # Show the handles above any rectangle created after them
+        tk_call(canvas_path, 'itemconfigure', 'resize_handle', '-state', 'normal')
+        tk_call(canvas_path, 'raise', 'resize_handle')
 
     def _on_canvas_click(self, event):
         """Handle mouse click on canvas."""
@@ -574,9 +782,9 @@ class CropVideoGUI:
             new_x = max(0, min(new_x, width - selected_rect.width))
             new_y = max(0, min(new_y, height - selected_rect.height))
 
-        # Update rectangle position
+        # Update rectangle position - only its own canvas items change
         selected_rect.move(new_x, new_y)
-        self._update_preview()
+        self._request_preview_update(selected_rect)
 
     def _handle_resizing_drag(self, current_x: int, current_y: int):
         """Handle dragging during rectangle resizing."""
@@ -646,7 +854,7 @@ class CropVideoGUI:
         selected_rect.y = new_y
         selected_rect.width = new_width
         selected_rect.height = new_height
-        self._update_preview()
+        self._request_preview_update(selected_rect)
 
     def _on_canvas_release(self, event):
         """Handle mouse release on canvas."""
@@ -731,6 +939,33 @@ class CropVideoGUI:
 
     def _on_canvas_motion(self, event):
         """Handle mouse motion for cursor changes and visual feedback."""
+        # Mice report motion far more often than the display refreshes, so
+        # hit-test at most once per MOTION_INTERVAL_S
+        now = time.monotonic()
+        if now - self._last_motion_time < MOTION_INTERVAL_S:
+            # Remember the latest position so the cursor matches where the
+            # mouse stopped, even if no further motion event arrives
+            self._pending_motion = (event.x, event.y)
+            if self._motion_after_id is None:
+                self._motion_after_id = self.root.after(
+                    int(MOTION_INTERVAL_S * 1000), self._flush_pending_motion)
+            return
+
+        self._last_motion_time = now
+        self._pending_motion = None
+        self._update_cursor(event.x, event.y)
+
+    def _flush_pending_motion(self):
+        """Apply the last motion event skipped by the _on_canvas_motion throttle."""
+        self._motion_after_id = None
+        if self._pending_motion is not None:
+            canvas_x, canvas_y = self._pending_motion
+            self._pending_motion = None
+            self._last_motion_time = time.monotonic()
+            self._update_cursor(canvas_x, canvas_y)
+
+    def _update_cursor(self, canvas_x: int, canvas_y: int):
+        """Set the canvas cursor for the rectangle or handle under a canvas position."""
         if self.drawing_rectangle or self.dragging_rectangle or self.resizing_rectangle:
             return  # Don't change cursor during active operations
 
@@ -739,7 +974,7 @@ class CropVideoGUI:
             return
 
         # Convert to video coordinates
-        video_x, video_y = self._canvas_to_video_coords(event.x, event.y)
+        video_x, video_y = self._canvas_to_video_coords(canvas_x, canvas_y)
 
         # Find rectangle under cursor
         rect = self.rectangle_manager.get_rectangle_at_point(video_x, video_y)
@@ -783,29 +1018,34 @@ class CropVideoGUI:
         Returns:
             Optional[str]: Handle identifier ('tl', 'tr', 'bl', 'br', 'top', 'bottom', 'left', 'right') or None
         """
-        handle_size = 8  # Size of resize handles in pixels (in video space)
+        # Handle size in video space, updated whenever the preview scale changes
+        hit = self._handle_hit_size
 
-        # Convert handle size from canvas to video coordinates
-        handle_size_video = int(handle_size / min(self.scale_x, self.scale_y))
+        # Read the edges once - x2 and y2 are computed properties
+        x1, y1, x2, y2 = rect.x, rect.y, rect.x2, rect.y2
+        near_x1 = abs(video_x - x1) <= hit
+        near_x2 = abs(video_x - x2) <= hit
+        near_y1 = abs(video_y - y1) <= hit
+        near_y2 = abs(video_y - y2) <= hit
 
         # Check corner handles first (higher priority)
-        if abs(video_x - rect.x) <= handle_size_video and abs(video_y - rect.y) <= handle_size_video:
+        if near_x1 and near_y1:
             return 'tl'  # Top-left
-        elif abs(video_x - rect.x2) <= handle_size_video and abs(video_y - rect.y) <= handle_size_video:
+        elif near_x2 and near_y1:
             return 'tr'  # Top-right
-        elif abs(video_x - rect.x) <= handle_size_video and abs(video_y - rect.y2) <= handle_size_video:
+        elif near_x1 and near_y2:
             return 'bl'  # Bottom-left
-        elif abs(video_x - rect.x2) <= handle_size_video and abs(video_y - rect.y2) <= handle_size_video:
+        elif near_x2 and near_y2:
             return 'br'  # Bottom-right
 
         # Check edge handles
-        elif abs(video_y - rect.y) <= handle_size_video and rect.x < video_x < rect.x2:
+        elif near_y1 and x1 < video_x < x2:
             return 'top'
-        elif abs(video_y - rect.y2) <= handle_size_video and rect.x < video_x < rect.x2:
+        elif near_y2 and x1 < video_x < x2:
             return 'bottom'
-        elif abs(video_x - rect.x) <= handle_size_video and rect.y < video_y < rect.y2:
+        elif near_x1 and y1 < video_y < y2:
             return 'left'
-        elif abs(video_x - rect.x2) <= handle_size_video and rect.y < video_y < rect.y2:
+        elif near_x2 and y1 < video_y < y2:
             return 'right'
 
         return None
@@ -19,6 +19,7 @@ Author: Video Processing Project
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Add the parent directory to Python path to import shared modules
@@ -36,34 +37,27 @@ def check_gui_dependencies():
     """
     missing_deps = []
 
+    # Only locate the modules - the GUI imports them when it starts, so loading
+    # the heavy C extensions here would just add to startup time
+
     # Check tkinter availability
-    try:
-        import tkinter
-    except ImportError:
+    if importlib.util.find_spec("tkinter") is None:
         missing_deps.append("tkinter")
 
     # Check PIL/Pillow availability
-    try:
-        from PIL import Image, ImageTk
-    except ImportError:
+    if importlib.util.find_spec("PIL") is None:
         missing_deps.append("Pillow (PIL)")
 
     # Check OpenCV availability
-    try:
-        import cv2
-    except ImportError:
+    if importlib.util.find_spec("cv2") is None:
         missing_deps.append("opencv-python")
 
     # Check subprocess availability (should be built-in)
-    try:
-        import subprocess
-    except ImportError:
+    if importlib.util.find_spec("subprocess") is None:
         missing_deps.append("subprocess (built-in module)")
 
     # Check numpy availability
-    try:
-        import numpy
-    except ImportError:
+    if importlib.util.find_spec("numpy") is None:
         missing_deps.append("numpy")
 
     if missing_deps:
@@ -7,7 +7,7 @@ path validation, directory creation, and file discovery.
 
 import os
 from pathlib import Path
-from typing import List, Optional, Generator
+from typing import List, Optional, Generator, Set
 
 
 def validate_input_path(path: str) -> bool:
@@ -106,28 +106,32 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
-def get_unique_filename(base_path: str, extension: str = "") -> str:
+def get_unique_filename(base_path: str, extension: str = "",
+                        reserved_paths: Optional[Set[str]] = None) -> str:
     """
     Generate a unique filename by adding a number suffix if file exists.
 
     Args:
         base_path (str): Base path without extension
         extension (str): File extension (optional)
+        reserved_paths (Optional[Set[str]]): Paths to treat as taken even though
+            they do not exist yet (e.g. outputs of jobs that are still running)
 
     Returns:
         str: Unique filename that doesn't exist on filesystem
     """
+    reserved_paths = reserved_paths or set()
     counter = 1
     original_path = f"{base_path}{extension}"
 
     # If file doesn't exist, return original path
-    if not Path(original_path).exists():
+    if original_path not in reserved_paths and not Path(original_path).exists():
         return original_path
 
     # Find a unique name by adding numbers
     while True:
         new_path = f"{base_path}_{counter}{extension}"
-        if not Path(new_path).exists():
+        if new_path not in reserved_paths and not Path(new_path).exists():
             return new_path
         counter += 1
 
@@ -10,6 +10,10 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 
+# File extensions accepted as videos by is_valid_video_file
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
+
+
 def get_video_duration(video_path: str) -> Optional[float]:
     """
     Get the duration of a video file in seconds.
@@ -46,6 +50,38 @@ def get_video_duration(video_path: str) -> Optional[float]:
         return None
 
 
+def open_video_capture(video_path: str, hardware_acceleration: bool = True) -> cv2.VideoCapture:
+    """
+    Open a video for decoding, preferring hardware-accelerated decode.
+
+    Hardware decoding (VAAPI, NVDEC, VideoToolbox, D3D11, ...) requires an
+    OpenCV build (4.5.2+) with the FFmpeg backend and a supported GPU. When it is
+    not available, the default software decoder is used, so callers always get
+    a capture object and should check isOpened() as usual.
+
+    Args:
+        video_path (str): Path to the video file
+        hardware_acceleration (bool): Whether to try hardware decoding first
+
+    Returns:
+        cv2.VideoCapture: Video capture object
+    """
+    if hardware_acceleration and hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+        try:
+            cap = cv2.VideoCapture(
+                video_path, cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except (cv2.error, TypeError):
+            # Older builds do not accept capture parameters - use software decode
+            pass
+
+    return cv2.VideoCapture(video_path)
+
+
 def is_valid_video_file(file_path: str) -> bool:
     """
     Check if a file is a valid video file.
@@ -61,10 +97,9 @@ def is_valid_video_file(file_path: str) -> bool:
         return False
 
     # Check file extension
-    valid_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
     file_extension = Path(file_path).suffix.lower()
 
-    if file_extension not in valid_extensions:
+    if file_extension not in VIDEO_EXTENSIONS:
         return False
 
     # Try to open with OpenCV to verify it's readable